@@ -7,20 +7,91 @@ Advanced MCP server with OpenRouter integration and comprehensive tools
 
 import json
 import asyncio
+import atexit
 import os
 import sqlite3
+import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from secure_api_manager import api_manager
-import glob
 import re
-import py_compile
+import ast
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+# Directories that are never worth auditing, pruned before any .gitignore matching
+SKIP_DIRS = frozenset({
+    '.git', '.hg', '.svn', '.venv', 'venv', '__pycache__', 'node_modules',
+    'target', 'dist', 'build', '.tox', '.mypy_cache', '.pytest_cache'
+})
+
+OPENROUTER_KEY_PATTERN = re.compile(r'sk-or-v1-[a-f0-9]{64}')
+STRIPE_KEY_PATTERN = re.compile(r'sk_live_[a-zA-Z0-9]{24}')
+
+def _count_lines(text: str) -> int:
+    """Line count without splitting; a final line without a newline still counts"""
+    return text.count('\n') + (1 if text and not text.endswith('\n') else 0)
+
+def _scan_worker(path: str, do_syntax: bool = True, do_secrets: bool = True,
+                 do_lines: bool = True) -> Tuple[int, Optional[str], List[str]]:
+    """Scan a single file for the project audit (runs in a worker process)"""
+    syntax_error = None
+    secrets = []
+    do_syntax = do_syntax and path.endswith('.py')
+
+    if not (do_syntax or do_secrets or do_lines):
+        return 0, None, secrets
+
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            source = f.read()
+    except Exception:
+        return 0, None, secrets  # Ignore files that can't be opened
+
+    line_count = 0
+    if do_lines:
+        line_count = _count_lines(source)
+
+    # Check for syntax errors in Python files
+    if do_syntax:
+        try:
+            ast.parse(source, filename=path)
+        except (SyntaxError, ValueError) as e:
+            syntax_error = f"{path}: {e}"
+
+    # Check for hardcoded secrets
+    if do_secrets and (OPENROUTER_KEY_PATTERN.search(source) or STRIPE_KEY_PATTERN.search(source)):
+        for line in source.splitlines():
+            if OPENROUTER_KEY_PATTERN.search(line):
+                secrets.append(f"{path}: Found OpenRouter API key")
+            if STRIPE_KEY_PATTERN.search(line):
+                secrets.append(f"{path}: Found Stripe API key")
+
+    return line_count, syntax_error, secrets
 
 class EnhancedClaudeCodeMCPServer:
-    def __init__(self):
+    _INSERT_SQL = '''
+        INSERT INTO tool_usage (tool_name, parameters, result, execution_time, success)
+        VALUES (?, ?, ?, ?, ?)
+    '''
+    LOG_BATCH_SIZE = 32
+    CLOCK_TICK_SECONDS = 0.01
+
+    def __init__(self, cached_timestamps: bool = False):
         self.name = "enhanced-claude-code"
         self.version = "1.0.0"
         self.openrouter_api_key = os.getenv("OPENROUTER_API_KEY", api_manager.get_api_key('openrouter'))
+        self._process_pool = None
+
+        # Optional coarse clock: response timestamps are refreshed every
+        # CLOCK_TICK_SECONDS instead of being formatted on every call
+        self.cached_timestamps = cached_timestamps
+        self._now_iso = datetime.now().isoformat()
+        self._clock_task = None
         
         # Initialize database
         self.init_database()
@@ -82,8 +153,8 @@ class EnhancedClaudeCodeMCPServer:
 
     def init_database(self):
         """Initialize SQLite database for enhanced features"""
-        conn = sqlite3.connect('enhanced_claude_code.db')
-        cursor = conn.cursor()
+        self._db = sqlite3.connect('enhanced_claude_code.db', cached_statements=256)
+        cursor = self._db.cursor()
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS tool_usage (
@@ -106,12 +177,45 @@ class EnhancedClaudeCodeMCPServer:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        self._db.commit()
+
+        # Tool usage rows are queued and written in batches through one reused cursor
+        self._log_cursor = self._db.cursor()
+        self._log_queue = []
+        atexit.register(self.flush_tool_usage)
+        atexit.register(self.shutdown_process_pool)
+
+    def shutdown_process_pool(self):
+        """Stop the project audit worker processes, if any were started"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+            self._process_pool = None
+
+    async def _tick(self):
+        """Refresh the cached ISO timestamp"""
+        while True:
+            self._now_iso = datetime.now().isoformat()
+            await asyncio.sleep(self.CLOCK_TICK_SECONDS)
+
+    def _timestamp(self) -> str:
+        """Current ISO timestamp, served from the cached clock when enabled"""
+        if self._clock_task is not None and not self._clock_task.done():
+            return self._now_iso
+        return datetime.now().isoformat()
+
+    def stop_clock(self):
+        """Cancel the cached clock task; timestamps are formatted per call until it restarts"""
+        if self._clock_task is not None:
+            self._clock_task.cancel()
+            self._clock_task = None
 
     async def handle_tool_call(self, tool_name: str, parameters: Dict) -> Dict:
         """Handle tool execution with enhanced logging"""
-        start_time = datetime.now()
+        if self.cached_timestamps and (self._clock_task is None or self._clock_task.done()):
+            self._now_iso = datetime.now().isoformat()
+            self._clock_task = asyncio.create_task(self._tick())
+
+        start_time = time.perf_counter()
         
         try:
             if tool_name == "openrouter_cost_optimize":
@@ -127,7 +231,7 @@ class EnhancedClaudeCodeMCPServer:
             else:
                 result = {"error": f"Unknown tool: {tool_name}"}
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             # Log usage
             self.log_tool_usage(tool_name, parameters, result, execution_time, True)
@@ -136,11 +240,11 @@ class EnhancedClaudeCodeMCPServer:
                 "success": True,
                 "result": result,
                 "execution_time": execution_time,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._timestamp()
             }
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_result = {"error": str(e)}
             
             self.log_tool_usage(tool_name, parameters, error_result, execution_time, False)
@@ -149,7 +253,7 @@ class EnhancedClaudeCodeMCPServer:
                 "success": False,
                 "error": str(e),
                 "execution_time": execution_time,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._timestamp()
             }
 
     async def openrouter_cost_optimize(self, parameters: Dict) -> Dict:
@@ -219,50 +323,40 @@ class EnhancedClaudeCodeMCPServer:
 
     async def project_audit(self, parameters: Dict) -> Dict:
         """Comprehensive project audit"""
-        import glob
-        import os
-        import re
-        import py_compile
-
         project_path = parameters.get("project_path", "C:/Users/brend/repos")
         audit_type = parameters.get("audit_type", "full")
+        do_syntax = audit_type in ("full", "performance")
+        do_secrets = audit_type in ("full", "security")
+        do_lines = audit_type != "security"
 
-        total_files = 0
+        loop = asyncio.get_running_loop()
+
+        # Directory walk is pure I/O - keep it on the default thread pool
+        files_to_scan = await loop.run_in_executor(None, self._list_audit_files, project_path)
+
+        # Parsing and regex scanning are CPU-bound - fan out across processes
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        scan_results = await asyncio.gather(
+            *(loop.run_in_executor(self._process_pool, _scan_worker, p, do_syntax, do_secrets, do_lines)
+              for p in files_to_scan)
+        )
+
+        total_files = len(files_to_scan)
         total_lines = 0
         syntax_errors = []
         hardcoded_secrets = []
 
-        files_to_scan = glob.glob(os.path.join(project_path, '**/*'), recursive=True)
-
-        for file_path in files_to_scan:
-            if os.path.isfile(file_path):
-                total_files += 1
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                        total_lines += len(lines)
-
-                        # Check for syntax errors in Python files
-                        if file_path.endswith('.py'):
-                            try:
-                                py_compile.compile(file_path, doraise=True)
-                            except py_compile.PyCompileError as e:
-                                syntax_errors.append(f"{file_path}: {e}")
-
-                        # Check for hardcoded secrets
-                        for line in lines:
-                            if re.search(r'sk-or-v1-[a-f0-9]{64}', line):
-                                hardcoded_secrets.append(f"{file_path}: Found OpenRouter API key")
-                            if re.search(r'sk_live_[a-zA-Z0-9]{24}', line):
-                                hardcoded_secrets.append(f"{file_path}: Found Stripe API key")
-
-                except Exception as e:
-                    pass # Ignore files that can't be opened
+        for line_count, syntax_error, secrets in scan_results:
+            total_lines += line_count
+            if syntax_error:
+                syntax_errors.append(syntax_error)
+            hardcoded_secrets.extend(secrets)
 
         audit_result = {
             "project_path": project_path,
             "audit_type": audit_type,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(),
             "overall_health": f"{100 - len(syntax_errors) - len(hardcoded_secrets)}% Healthy",
             "findings": {
                 "critical_issues": len(hardcoded_secrets),
@@ -282,6 +376,80 @@ class EnhancedClaudeCodeMCPServer:
 
         return audit_result
 
+    @staticmethod
+    def _read_gitignore(directory: str):
+        """Compile the .gitignore in directory, or None when it has none"""
+        gitignore = os.path.join(directory, '.gitignore')
+        if not os.path.isfile(gitignore):
+            return None
+        with open(gitignore, 'r', encoding='utf-8', errors='ignore') as f:
+            return pathspec.PathSpec.from_lines('gitwildmatch', f.read().splitlines())
+
+    @classmethod
+    def _parent_gitignore_specs(cls, project_path: str) -> List[Tuple[str, Any]]:
+        """(directory, spec) for each .gitignore above the project, up to its repository root
+
+        Outside a repository nothing above the project applies, so the result is empty.
+        """
+        specs = []
+        directory = os.path.abspath(project_path)
+        while not os.path.isdir(os.path.join(directory, '.git')):
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return []
+            directory = parent
+            spec = cls._read_gitignore(directory)
+            if spec is not None:
+                specs.append((directory, spec))
+        return specs
+
+    @classmethod
+    def _list_audit_files(cls, project_path: str) -> List[str]:
+        """List the regular files under the audited project, honoring SKIP_DIRS and .gitignore"""
+        use_gitignore = pathspec is not None
+        files = []
+        # Each .gitignore applies to paths relative to its own directory, as git does
+        pending = [(project_path, cls._parent_gitignore_specs(project_path) if use_gitignore else [])]
+
+        while pending:
+            directory, specs = pending.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            if use_gitignore:
+                local_spec = cls._read_gitignore(directory)
+                if local_spec is not None:
+                    specs = specs + [(directory, local_spec)]
+
+            for entry in entries:
+                # Hidden entries are skipped, as with glob's recursive '**' matching
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir and entry.name in SKIP_DIRS:
+                    continue
+                if specs and cls._is_ignored(entry.path, is_dir, specs):
+                    continue
+                if is_dir:
+                    pending.append((entry.path, specs))
+                elif entry.is_file():
+                    files.append(entry.path)
+
+        return files
+
+    @staticmethod
+    def _is_ignored(path: str, is_dir: bool, specs: List[Tuple[str, Any]]) -> bool:
+        """Whether any .gitignore spec, matched relative to its own directory, excludes path"""
+        for base, spec in specs:
+            rel_path = os.path.relpath(path, base).replace(os.sep, '/')
+            if spec.match_file(rel_path + '/' if is_dir else rel_path):
+                return True
+        return False
+
     async def code_review_advanced(self, parameters: Dict) -> Dict:
         """Advanced multi-perspective code review"""
         code = parameters.get("code", "")
@@ -295,7 +463,7 @@ class EnhancedClaudeCodeMCPServer:
         analysis = {
             "filename": filename,
             "language": language,
-            "lines_of_code": len(code.split('\n')),
+            "lines_of_code": _count_lines(code),
             "overall_score": 8.5,
             "complexity_score": 6,
             "maintainability": "Good",
@@ -332,7 +500,7 @@ class EnhancedClaudeCodeMCPServer:
         # Simulate business intelligence analysis
         bi_result = {
             "analysis_type": analysis_type,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(),
             "financial_health": {
                 "health_score": 87.5,
                 "profit_margin": 30.2,
@@ -378,21 +546,22 @@ class EnhancedClaudeCodeMCPServer:
 
     def log_tool_usage(self, tool_name: str, parameters: Dict, result: Dict, execution_time: float, success: bool):
         """Log tool usage to database"""
-        conn = sqlite3.connect('enhanced_claude_code.db')
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO tool_usage (tool_name, parameters, result, execution_time, success)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (tool_name, json.dumps(parameters), json.dumps(result), execution_time, success))
-        
-        conn.commit()
-        conn.close()
+        self._log_queue.append((tool_name, json.dumps(parameters), json.dumps(result), execution_time, success))
+        if len(self._log_queue) >= self.LOG_BATCH_SIZE:
+            self.flush_tool_usage()
+
+    def flush_tool_usage(self):
+        """Write queued tool usage rows in a single transaction"""
+        if not self._log_queue:
+            return
+        rows, self._log_queue = self._log_queue, []
+        self._log_cursor.executemany(self._INSERT_SQL, rows)
+        self._db.commit()
 
     def get_usage_statistics(self) -> Dict:
         """Get usage statistics"""
-        conn = sqlite3.connect('enhanced_claude_code.db')
-        cursor = conn.cursor()
+        self.flush_tool_usage()
+        cursor = self._db.cursor()
         
         cursor.execute('SELECT COUNT(*) FROM tool_usage')
         total_calls = cursor.fetchone()[0]
@@ -410,8 +579,7 @@ class EnhancedClaudeCodeMCPServer:
             ORDER BY COUNT(*) DESC
         ''')
         popular_tools = cursor.fetchall()
-        
-        conn.close()
+        cursor.close()
         
         return {
             "total_tool_calls": total_calls,
@@ -420,7 +588,7 @@ class EnhancedClaudeCodeMCPServer:
             "average_execution_time": avg_execution_time,
             "most_popular_tools": dict(popular_tools),
             "server_uptime": "99.9%",
-            "last_updated": datetime.now().isoformat()
+            "last_updated": self._timestamp()
         }
 
 def main():
@@ -428,7 +596,9 @@ def main():
     print("Enhanced Claude Code MCP Server")
     print("=" * 50)
     
-    server = EnhancedClaudeCodeMCPServer()
+    server = EnhancedClaudeCodeMCPServer(
+        cached_timestamps=os.getenv("MCP_CACHED_TIMESTAMPS", "").lower() in ("1", "true", "yes")
+    )
     
     print(f"Server: {server.name} v{server.version}")
     print(f"Available tools: {len(server.tools)}")
@@ -464,7 +634,13 @@ def main():
         print(f"  Success rate: {stats['success_rate']:.1f}%")
         print(f"  Avg execution time: {stats['average_execution_time']:.3f}s")
     
-    asyncio.run(test_tools())
+    async def run():
+        try:
+            await test_tools()
+        finally:
+            server.stop_clock()
+    
+    asyncio.run(run())
     
     print("\nEnhanced MCP Server ready for integration!")
 
@@ -6,13 +6,17 @@ Provides persistent memory storage for Claude Code sessions with cross-session p
 
 import json
 import asyncio
+import atexit
 import sys
 import os
 import sqlite3
+import threading
 import time
 import hashlib
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
 import logging
 from secure_api_manager import api_manager
 
@@ -23,22 +27,264 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mcp-memory-server")
 
+# JSON codec: orjson when installed, stdlib json otherwise
+try:
+    import orjson
+    
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option).decode()
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+    
+except ImportError:
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return json.dumps(obj, default=str, indent=2 if indent else None)
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
+    
+    _loads = json.loads
+
+# Memory categories and the MCP tools/list payload never change at runtime,
+# so both are built once at import
+MEMORY_CATEGORIES = {
+    "openrouter": "OpenRouter API configuration and usage",
+    "enterprise": "Enterprise platform states and configurations", 
+    "revenue": "Revenue generation system states",
+    "session": "Session state and user preferences",
+    "performance": "System performance metrics and monitoring",
+    "dashboard": "Dashboard states and configurations",
+    "user_prefs": "User preferences and settings"
+}
+_CATEGORY_NAMES = list(MEMORY_CATEGORIES)
+
+TOOLS_LIST = {
+    "tools": [
+        {
+            "name": "memory_store",
+            "description": "Store persistent memory across Claude Code sessions",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "key": {"type": "string", "description": "Memory key identifier"},
+                    "value": {"description": "Value to store (any type)"},
+                    "category": {
+                        "type": "string", 
+                        "enum": _CATEGORY_NAMES,
+                        "default": "general",
+                        "description": "Memory category for organization"
+                    },
+                    "expires_hours": {"type": "integer", "description": "Hours until expiration (optional)"},
+                    "session_id": {"type": "string", "description": "Session identifier (optional)"},
+                    "metadata": {"type": "object", "description": "Additional metadata (optional)"}
+                },
+                "required": ["key", "value"]
+            }
+        },
+        {
+            "name": "memory_retrieve",
+            "description": "Retrieve persistent memory from storage",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "key": {"type": "string", "description": "Memory key to retrieve"},
+                    "default": {"description": "Default value if key not found"}
+                },
+                "required": ["key"]
+            }
+        },
+        {
+            "name": "memory_list",
+            "description": "List memory entries by category",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "category": {
+                        "type": "string",
+                        "enum": _CATEGORY_NAMES,
+                        "description": "Category to list"
+                    }
+                },
+                "required": ["category"]
+            }
+        },
+        {
+            "name": "memory_delete",
+            "description": "Delete a memory entry",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "key": {"type": "string", "description": "Memory key to delete"}
+                },
+                "required": ["key"]
+            }
+        },
+        {
+            "name": "memory_stats",
+            "description": "Get memory storage statistics and health info",
+            "inputSchema": {
+                "type": "object",
+                "properties": {}
+            }
+        },
+        {
+            "name": "memory_cleanup",
+            "description": "Clean up expired memory entries",
+            "inputSchema": {
+                "type": "object",
+                "properties": {}
+            }
+        },
+        {
+            "name": "session_create",
+            "description": "Create or update session tracking",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "session_id": {"type": "string", "description": "Session identifier"},
+                    "context_data": {"type": "object", "description": "Session context data"}
+                },
+                "required": ["session_id"]
+            }
+        }
+    ]
+}
+_TOOLS_LIST_RESPONSE = _dumps_bytes(TOOLS_LIST)
+
 class MCPMemoryPersistenceServer:
-    def __init__(self):
+    # Applied once when the shared connection is opened
+    CONNECTION_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA mmap_size=30000000000",
+        "PRAGMA foreign_keys=OFF",
+    )
+    
+    # Bumped whenever memory_storage changes layout; see _migrate_memory_storage
+    #   v1: memory_key is the clustered primary key (WITHOUT ROWID)
+    #   v2: values are stored as JSON text and the value_type column is gone
+    #   v3: expires_at is an INTEGER unix timestamp
+    SCHEMA_VERSION = 3
+    _DDL_MEMORY_STORAGE = '''
+        CREATE TABLE IF NOT EXISTS memory_storage (
+            memory_key TEXT PRIMARY KEY,
+            category TEXT NOT NULL,
+            value TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            expires_at INTEGER,
+            session_id TEXT,
+            metadata TEXT DEFAULT '{}'
+        ) WITHOUT ROWID
+    '''
+    
+    # Fixed statements, kept as constants so the sqlite3 statement cache always hits
+    # Upsert rather than INSERT OR REPLACE: updates in place and keeps created_at
+    _SQL_INSERT = '''
+        INSERT INTO memory_storage 
+        (memory_key, category, value, expires_at, session_id, metadata, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(memory_key) DO UPDATE SET
+            category = excluded.category,
+            value = excluded.value,
+            expires_at = excluded.expires_at,
+            session_id = excluded.session_id,
+            metadata = excluded.metadata,
+            updated_at = CURRENT_TIMESTAMP
+    '''
+    _SQL_SELECT_BY_KEY = '''
+        SELECT value
+        FROM memory_storage 
+        WHERE memory_key = ? AND (expires_at IS NULL OR expires_at > ?)
+    '''
+    _SQL_LIST_BY_CAT = '''
+        SELECT memory_key, value, created_at, updated_at, metadata
+        FROM memory_storage 
+        WHERE category = ? AND (expires_at IS NULL OR expires_at > ?)
+        ORDER BY updated_at DESC
+    '''
+    # Same listing, one JSON object per row serialized by SQLite itself: values/metadata
+    # are stored as JSON text, so json() embeds them without a Python round trip.
+    # Rows are joined in Python because json_group_array only honours ORDER BY from 3.44.
+    _SQL_LIST_BY_CAT_JSON = '''
+        SELECT json_object(
+                   'key', memory_key,
+                   'value', json(value),
+                   'created_at', created_at,
+                   'updated_at', updated_at,
+                   'metadata', json(COALESCE(metadata, '{}'))
+               )
+        FROM memory_storage
+        WHERE category = ? AND (expires_at IS NULL OR expires_at > ?)
+        ORDER BY updated_at DESC
+    '''
+    _SQL_DELETE = 'DELETE FROM memory_storage WHERE memory_key = ?'
+    _SQL_CLEANUP = '''
+        DELETE FROM memory_storage 
+        WHERE expires_at IS NOT NULL AND expires_at < ?
+    '''
+    _SQL_COUNT_LIVE = 'SELECT COUNT(*) FROM memory_storage WHERE expires_at IS NULL OR expires_at > ?'
+    _SQL_COUNT_BY_CAT = '''
+        SELECT category, COUNT(*) as count 
+        FROM memory_storage 
+        WHERE expires_at IS NULL OR expires_at > ?
+        GROUP BY category
+    '''
+    _SQL_UPSERT_SESSION = '''
+        INSERT OR REPLACE INTO session_tracking 
+        (session_id, context_data, last_active)
+        VALUES (?, ?, CURRENT_TIMESTAMP)
+    '''
+    
+    # Write-buffer mode: rows are flushed when this many are queued or every interval
+    WRITE_BUFFER_SIZE = 64
+    WRITE_BUFFER_INTERVAL = 1.0
+    
+    # Seconds between background sweeps of expired memory
+    CLEANUP_INTERVAL = 300
+    
+    def __init__(self, write_buffer: bool = False):
         # Initialize OpenRouter configuration
         self.openrouter_key = os.getenv("OPENROUTER_API_KEY", api_manager.get_api_key('openrouter'))
         self.db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp_memory_persistence.db")
+        
+        # Single long-lived connection shared by every operation
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                     cached_statements=256)
+        self._conn.row_factory = sqlite3.Row  # Enable dict-like access
+        for pragma in self.CONNECTION_PRAGMAS:
+            self._conn.execute(pragma)
+        self._lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
+        
+        # Optional buffering of store_memory writes into batched transactions
+        self.write_buffer = write_buffer
+        self._write_queue = deque()
+        
+        # SQLite serializes writes anyway, so one worker keeps blocking calls off the event loop
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp-memory-db")
+        
         self.init_database()
         
         # Memory categories for organization
-        self.memory_categories = {
-            "openrouter": "OpenRouter API configuration and usage",
-            "enterprise": "Enterprise platform states and configurations", 
-            "revenue": "Revenue generation system states",
-            "session": "Session state and user preferences",
-            "performance": "System performance metrics and monitoring",
-            "dashboard": "Dashboard states and configurations",
-            "user_prefs": "User preferences and settings"
+        self.memory_categories = MEMORY_CATEGORIES
+        
+        # tools/call handlers, keyed by tool name
+        self._tool_dispatch = {
+            "memory_store": self._do_store,
+            "memory_retrieve": self._do_retrieve,
+            "memory_list": self._do_list,
+            "memory_delete": self._do_delete,
+            "memory_stats": self._do_stats,
+            "memory_cleanup": self._do_cleanup,
+            "session_create": self._do_session_create,
         }
         
         logger.info(f"MCP Memory Persistence Server initialized with database: {self.db_path}")
@@ -46,24 +292,12 @@ class MCPMemoryPersistenceServer:
     def init_database(self):
         """Initialize SQLite database for persistent memory storage"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
-            # Create memory storage table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS memory_storage (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    memory_key TEXT UNIQUE NOT NULL,
-                    category TEXT NOT NULL,
-                    value TEXT NOT NULL,
-                    value_type TEXT DEFAULT 'string',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    expires_at TIMESTAMP NULL,
-                    session_id TEXT,
-                    metadata TEXT DEFAULT '{}'
-                )
-            ''')
+            # Create memory storage table, upgrading older layouts in place
+            self._migrate_memory_storage(cursor)
+            cursor.execute(self._DDL_MEMORY_STORAGE)
             
             # Create session tracking table
             cursor.execute('''
@@ -90,39 +324,96 @@ class MCPMemoryPersistenceServer:
             ''')
             
             # Create indices for better performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_memory_key ON memory_storage(memory_key)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_category ON memory_storage(category)')
+            # Serves category filters and the updated_at ordering of list_memory_by_category
+            cursor.execute('DROP INDEX IF EXISTS idx_category')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_cat_listing ON memory_storage(category, updated_at DESC)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_session ON memory_storage(session_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_expires ON memory_storage(expires_at)')
             
-            conn.commit()
-            conn.close()
+            # Most rows never expire, so only index the ones that do
+            cursor.execute('DROP INDEX IF EXISTS idx_expires')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_expires_set ON memory_storage(expires_at) WHERE expires_at IS NOT NULL')
+            
             logger.info("Database initialized successfully")
             
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
             raise
     
+    # Converts a pre-v2 value/value_type pair into JSON text
+    _SQL_LEGACY_VALUE_TO_JSON = '''
+        CASE
+            WHEN value_type = 'json' THEN value
+            WHEN value_type = 'boolean' OR (value_type = 'number' AND value IN ('True', 'False'))
+                THEN CASE WHEN lower(value) IN ('true', '1', 'yes', 'on') THEN 'true' ELSE 'false' END
+            WHEN value_type = 'number' AND json_valid(value) THEN value
+            ELSE json_quote(value)
+        END
+    '''
+    
+    def _migrate_memory_storage(self, cursor):
+        """Rebuild memory_storage when the database predates SCHEMA_VERSION"""
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_storage'"
+        ).fetchone()
+        
+        if exists and version < self.SCHEMA_VERSION:
+            # Each current column, expressed over the old table
+            columns = {
+                "memory_key": "memory_key",
+                "category": "category",
+                "value": "value",
+                "created_at": "created_at",
+                "updated_at": "updated_at",
+                "expires_at": "expires_at",
+                "session_id": "session_id",
+                "metadata": "metadata",
+            }
+            if version < 2:
+                columns["value"] = self._SQL_LEGACY_VALUE_TO_JSON
+            if version < 3:
+                # Old timestamps were naive local-time ISO strings
+                columns["expires_at"] = "CAST(strftime('%s', expires_at, 'utc') AS INTEGER)"
+            
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                cursor.execute('ALTER TABLE memory_storage RENAME TO _memory_storage_old')
+                cursor.execute(self._DDL_MEMORY_STORAGE)
+                cursor.execute(
+                    f'INSERT INTO memory_storage ({", ".join(columns)}) '
+                    f'SELECT {", ".join(columns.values())} FROM _memory_storage_old'
+                )
+                cursor.execute('DROP TABLE _memory_storage_old')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+            cursor.execute('COMMIT')
+            logger.info(f"Migrated memory_storage from schema version {version} to {self.SCHEMA_VERSION}")
+        
+        cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+    
     def get_connection(self):
-        """Get database connection with proper configuration"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access
-        return conn
+        """Get the shared database connection"""
+        return self._conn
+    
+    def close(self):
+        """Close the shared database connection"""
+        if not self._closed:
+            self.flush_writes()
+        with self._lock:
+            if self._closed:
+                return
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+            self._closed = True
     
     def cleanup_expired_memory(self):
         """Remove expired memory entries"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                DELETE FROM memory_storage 
-                WHERE expires_at IS NOT NULL AND expires_at < datetime('now')
-            ''')
-            
-            deleted_count = cursor.rowcount
-            conn.commit()
-            conn.close()
+            self.flush_writes()
+            with self._lock:
+                cursor = self.get_connection().execute(self._SQL_CLEANUP, (int(time.time()),))
+                deleted_count = cursor.rowcount
             
             if deleted_count > 0:
                 logger.info(f"Cleaned up {deleted_count} expired memory entries")
@@ -130,46 +421,64 @@ class MCPMemoryPersistenceServer:
         except Exception as e:
             logger.error(f"Memory cleanup failed: {e}")
     
+    def incremental_vacuum(self):
+        """Release free pages when the database uses auto_vacuum=INCREMENTAL"""
+        try:
+            with self._lock:
+                conn = self.get_connection()
+                if conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2:
+                    conn.execute('PRAGMA incremental_vacuum').fetchall()
+                    
+        except Exception as e:
+            logger.error(f"Incremental vacuum failed: {e}")
+    
+    def _serialize_row(self, key: str, value: Any, category: str = "general",
+                       expires_hours: Optional[int] = None, session_id: str = None,
+                       metadata: Dict = None, *, now: Optional[int] = None) -> Tuple:
+        """Build the memory_storage row for a value
+        
+        now is the unix time to compute expiry from; batches pass one shared value.
+        """
+        # JSON keeps the value's type, so no separate discriminator is stored
+        value_str = _dumps(value)
+        
+        # Calculate expiration if specified, as plain integer seconds
+        expires_at = None
+        if expires_hours:
+            expires_at = (now if now is not None else int(time.time())) + expires_hours * 3600
+        
+        # Serialize metadata
+        metadata_str = _dumps(metadata or {})
+        
+        return (key, category, value_str, expires_at, session_id, metadata_str)
+    
+    def _insert_rows(self, rows: List[Tuple]):
+        """Insert serialized rows in a single transaction"""
+        with self._lock:
+            conn = self.get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(self._SQL_INSERT, rows)
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    
     def store_memory(self, key: str, value: Any, category: str = "general", 
                     expires_hours: Optional[int] = None, session_id: str = None,
                     metadata: Dict = None) -> bool:
         """Store memory with persistence"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            row = self._serialize_row(key, value, category, expires_hours, session_id, metadata)
             
-            # Determine value type and serialize if needed
-            if isinstance(value, (dict, list)):
-                value_str = json.dumps(value)
-                value_type = "json"
-            elif isinstance(value, (int, float)):
-                value_str = str(value)
-                value_type = "number"
-            elif isinstance(value, bool):
-                value_str = str(value).lower()
-                value_type = "boolean"
+            if self.write_buffer:
+                self._write_queue.append(row)
+                if len(self._write_queue) >= self.WRITE_BUFFER_SIZE:
+                    self.flush_writes()
             else:
-                value_str = str(value)
-                value_type = "string"
-            
-            # Calculate expiration if specified
-            expires_at = None
-            if expires_hours:
-                expires_at = datetime.now() + timedelta(hours=expires_hours)
-                expires_at = expires_at.isoformat()
-            
-            # Serialize metadata
-            metadata_str = json.dumps(metadata or {})
-            
-            # Store or update memory
-            cursor.execute('''
-                INSERT OR REPLACE INTO memory_storage 
-                (memory_key, category, value, value_type, expires_at, session_id, metadata, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (key, category, value_str, value_type, expires_at, session_id, metadata_str))
-            
-            conn.commit()
-            conn.close()
+                # Store or update memory
+                with self._lock:
+                    self.get_connection().execute(self._SQL_INSERT, row)
             
             logger.info(f"Stored memory: {key} in category {category}")
             return True
@@ -178,39 +487,59 @@ class MCPMemoryPersistenceServer:
             logger.error(f"Failed to store memory {key}: {e}")
             return False
     
-    def retrieve_memory(self, key: str, default=None) -> Any:
-        """Retrieve memory from persistent storage"""
+    def store_memory_many(self, items: List[Tuple]) -> bool:
+        """Store several memories in one transaction
+        
+        Each item is a tuple of store_memory arguments:
+        (key, value[, category[, expires_hours[, session_id[, metadata]]]])
+        """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            now = int(time.time())
+            rows = [self._serialize_row(*item, now=now) for item in items]
+            self._insert_rows(rows)
             
-            cursor.execute('''
-                SELECT value, value_type, metadata, expires_at 
-                FROM memory_storage 
-                WHERE memory_key = ? AND (expires_at IS NULL OR expires_at > datetime('now'))
-            ''', (key,))
+            logger.info(f"Stored {len(rows)} memory entries")
+            return True
             
-            result = cursor.fetchone()
-            conn.close()
+        except Exception as e:
+            logger.error(f"Failed to store {len(items)} memory entries: {e}")
+            return False
+    
+    def flush_writes(self):
+        """Write any buffered store_memory rows"""
+        if not self._write_queue:
+            return
+        rows = list(self._write_queue)
+        self._write_queue.clear()
+        self._insert_rows(rows)
+    
+    async def run_db(self, func, *args):
+        """Run a blocking database method on the database worker thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, func, *args)
+    
+    async def run_write_flusher(self):
+        """Periodically flush buffered writes while write-buffer mode is on"""
+        while True:
+            await asyncio.sleep(self.WRITE_BUFFER_INTERVAL)
+            try:
+                await self.run_db(self.flush_writes)
+            except Exception as e:
+                logger.error(f"Buffered write flush failed: {e}")
+    
+    def retrieve_memory(self, key: str, default=None) -> Any:
+        """Retrieve memory from persistent storage"""
+        try:
+            self.flush_writes()
+            with self._lock:
+                result = self.get_connection().execute(self._SQL_SELECT_BY_KEY, (key, int(time.time()))).fetchone()
             
             if not result:
                 return default
             
-            value_str, value_type, metadata_str, expires_at = result
-            
-            # Deserialize based on type
-            if value_type == "json":
-                return json.loads(value_str)
-            elif value_type == "number":
-                try:
-                    return float(value_str) if '.' in value_str else int(value_str)
-                except ValueError:
-                    logger.error(f"Failed to parse number: {value_str}")
-                    return value_str
-            elif value_type == "boolean":
-                return value_str.lower() in ('true', '1', 'yes', 'on')
-            else:
-                return value_str
+            value_str = result[0]
+            
+            return self._deserialize_value(value_str)
                 
         except Exception as e:
             logger.error(f"Failed to retrieve memory {key}: {e}")
@@ -219,27 +548,18 @@ class MCPMemoryPersistenceServer:
     def list_memory_by_category(self, category: str) -> List[Dict]:
         """List all memory entries in a category"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT memory_key, value, value_type, created_at, updated_at, metadata
-                FROM memory_storage 
-                WHERE category = ? AND (expires_at IS NULL OR expires_at > datetime('now'))
-                ORDER BY updated_at DESC
-            ''', (category,))
-            
-            results = cursor.fetchall()
-            conn.close()
+            self.flush_writes()
+            with self._lock:
+                results = self.get_connection().execute(self._SQL_LIST_BY_CAT, (category, int(time.time()))).fetchall()
             
             memory_list = []
             for row in results:
                 memory_item = {
                     "key": row["memory_key"],
-                    "value": self._deserialize_value(row["value"], row["value_type"]),
+                    "value": self._deserialize_value(row["value"]),
                     "created_at": row["created_at"],
                     "updated_at": row["updated_at"],
-                    "metadata": json.loads(row["metadata"] or "{}")
+                    "metadata": self._load_metadata(row["metadata"] or "{}")
                 }
                 memory_list.append(memory_item)
             
@@ -249,17 +569,27 @@ class MCPMemoryPersistenceServer:
             logger.error(f"Failed to list memory for category {category}: {e}")
             return []
     
+    def list_memory_json(self, category: str) -> Tuple[str, int]:
+        """List a category as a ready-made JSON array string plus its entry count"""
+        try:
+            self.flush_writes()
+            with self._lock:
+                rows = self.get_connection().execute(
+                    self._SQL_LIST_BY_CAT_JSON, (category, int(time.time()))
+                ).fetchall()
+            return "[" + ",".join([row[0] for row in rows]) + "]", len(rows)
+            
+        except Exception as e:
+            logger.error(f"Failed to list memory for category {category}: {e}")
+            return "[]", 0
+    
     def delete_memory(self, key: str) -> bool:
         """Delete a memory entry"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('DELETE FROM memory_storage WHERE memory_key = ?', (key,))
-            deleted = cursor.rowcount > 0
-            
-            conn.commit()
-            conn.close()
+            self.flush_writes()
+            with self._lock:
+                cursor = self.get_connection().execute(self._SQL_DELETE, (key,))
+                deleted = cursor.rowcount > 0
             
             if deleted:
                 logger.info(f"Deleted memory: {key}")
@@ -270,45 +600,37 @@ class MCPMemoryPersistenceServer:
             logger.error(f"Failed to delete memory {key}: {e}")
             return False
     
-    def _deserialize_value(self, value_str: str, value_type: str) -> Any:
+    @staticmethod
+    def _deserialize_value(value_str: str) -> Any:
         """Helper to deserialize stored values"""
-        if value_type == "json":
-            return json.loads(value_str)
-        elif value_type == "number":
-            try:
-                return float(value_str) if '.' in value_str else int(value_str)
-            except ValueError:
-                logger.error(f"Failed to parse number: {value_str}")
-                return value_str
-        elif value_type == "boolean":
-            return value_str.lower() in ('true', '1', 'yes', 'on')
-        else:
-            return value_str
+        return _loads(value_str)
+    
+    @staticmethod
+    def _load_metadata(metadata_str: str) -> Dict:
+        """Helper to deserialize stored metadata"""
+        return _loads(metadata_str)
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory storage statistics"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Total memory entries
-            cursor.execute('SELECT COUNT(*) FROM memory_storage WHERE expires_at IS NULL OR expires_at > datetime("now")')
-            total_entries = cursor.fetchone()[0]
-            
-            # Memory by category
-            cursor.execute('''
-                SELECT category, COUNT(*) as count 
-                FROM memory_storage 
-                WHERE expires_at IS NULL OR expires_at > datetime("now")
-                GROUP BY category
-            ''')
-            category_stats = {row[0]: row[1] for row in cursor.fetchall()}
-            
-            # Database size
-            cursor.execute('SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()')
-            db_size = cursor.fetchone()[0]
+            self.flush_writes()
+            with self._lock:
+                cursor = self.get_connection().cursor()
+                now = int(time.time())
+                
+                # Total memory entries
+                cursor.execute(self._SQL_COUNT_LIVE, (now,))
+                total_entries = cursor.fetchone()[0]
+                
+                # Memory by category
+                cursor.execute(self._SQL_COUNT_BY_CAT, (now,))
+                category_stats = {row[0]: row[1] for row in cursor.fetchall()}
             
-            conn.close()
+            # Database size, including the WAL file
+            db_size = os.path.getsize(self.db_path)
+            wal_path = self.db_path + "-wal"
+            if os.path.exists(wal_path):
+                db_size += os.path.getsize(wal_path)
             
             return {
                 "total_entries": total_entries,
@@ -325,19 +647,10 @@ class MCPMemoryPersistenceServer:
     def create_session(self, session_id: str, context_data: Dict = None) -> bool:
         """Create or update a session entry"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            context_str = json.dumps(context_data or {})
+            context_str = _dumps(context_data or {})
             
-            cursor.execute('''
-                INSERT OR REPLACE INTO session_tracking 
-                (session_id, context_data, last_active)
-                VALUES (?, ?, CURRENT_TIMESTAMP)
-            ''', (session_id, context_str))
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self.get_connection().execute(self._SQL_UPSERT_SESSION, (session_id, context_str))
             
             logger.info(f"Created/updated session: {session_id}")
             return True
@@ -346,165 +659,81 @@ class MCPMemoryPersistenceServer:
             logger.error(f"Failed to create session {session_id}: {e}")
             return False
     
+    async def _do_store(self, arguments: Dict[str, Any]) -> str:
+        """Handle the memory_store tool"""
+        key = arguments.get("key")
+        value = arguments.get("value")
+        category = arguments.get("category", "general")
+        expires_hours = arguments.get("expires_hours")
+        session_id = arguments.get("session_id")
+        metadata = arguments.get("metadata", {})
+        
+        success = await self.run_db(self.store_memory, key, value, category, expires_hours, session_id, metadata)
+        return f"Memory stored successfully: {key}" if success else f"Failed to store memory: {key}"
+    
+    async def _do_retrieve(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle the memory_retrieve tool"""
+        key = arguments.get("key")
+        default = arguments.get("default")
+        
+        value = await self.run_db(self.retrieve_memory, key, default)
+        return {
+            "key": key,
+            "value": value,
+            "found": value != default
+        }
+    
+    async def _do_list(self, arguments: Dict[str, Any]) -> str:
+        """Handle the memory_list tool"""
+        category = arguments.get("category")
+        # Splice the SQLite-built array in as-is instead of
+        # materializing and re-encoding a list of dicts
+        entries, count = await self.run_db(self.list_memory_json, category)
+        return f'{{"category": {_dumps(category)}, "entries": {entries}, "count": {count}}}'
+    
+    async def _do_delete(self, arguments: Dict[str, Any]) -> str:
+        """Handle the memory_delete tool"""
+        key = arguments.get("key")
+        success = await self.run_db(self.delete_memory, key)
+        return f"Memory deleted: {key}" if success else f"Failed to delete memory: {key}"
+    
+    async def _do_stats(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle the memory_stats tool"""
+        return await self.run_db(self.get_memory_stats)
+    
+    async def _do_cleanup(self, arguments: Dict[str, Any]) -> str:
+        """Handle the memory_cleanup tool"""
+        await self.run_db(self.cleanup_expired_memory)
+        return "Memory cleanup completed successfully"
+    
+    async def _do_session_create(self, arguments: Dict[str, Any]) -> str:
+        """Handle the session_create tool"""
+        session_id = arguments.get("session_id")
+        context_data = arguments.get("context_data", {})
+        success = await self.run_db(self.create_session, session_id, context_data)
+        return f"Session created: {session_id}" if success else f"Failed to create session: {session_id}"
+    
     async def handle_mcp_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle MCP protocol requests for memory operations"""
         method = request.get("method")
         
         if method == "tools/list":
-            return {
-                "tools": [
-                    {
-                        "name": "memory_store",
-                        "description": "Store persistent memory across Claude Code sessions",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "key": {"type": "string", "description": "Memory key identifier"},
-                                "value": {"description": "Value to store (any type)"},
-                                "category": {
-                                    "type": "string", 
-                                    "enum": list(self.memory_categories.keys()),
-                                    "default": "general",
-                                    "description": "Memory category for organization"
-                                },
-                                "expires_hours": {"type": "integer", "description": "Hours until expiration (optional)"},
-                                "session_id": {"type": "string", "description": "Session identifier (optional)"},
-                                "metadata": {"type": "object", "description": "Additional metadata (optional)"}
-                            },
-                            "required": ["key", "value"]
-                        }
-                    },
-                    {
-                        "name": "memory_retrieve",
-                        "description": "Retrieve persistent memory from storage",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "key": {"type": "string", "description": "Memory key to retrieve"},
-                                "default": {"description": "Default value if key not found"}
-                            },
-                            "required": ["key"]
-                        }
-                    },
-                    {
-                        "name": "memory_list",
-                        "description": "List memory entries by category",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "category": {
-                                    "type": "string",
-                                    "enum": list(self.memory_categories.keys()),
-                                    "description": "Category to list"
-                                }
-                            },
-                            "required": ["category"]
-                        }
-                    },
-                    {
-                        "name": "memory_delete",
-                        "description": "Delete a memory entry",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "key": {"type": "string", "description": "Memory key to delete"}
-                            },
-                            "required": ["key"]
-                        }
-                    },
-                    {
-                        "name": "memory_stats",
-                        "description": "Get memory storage statistics and health info",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    },
-                    {
-                        "name": "memory_cleanup",
-                        "description": "Clean up expired memory entries",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    },
-                    {
-                        "name": "session_create",
-                        "description": "Create or update session tracking",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "session_id": {"type": "string", "description": "Session identifier"},
-                                "context_data": {"type": "object", "description": "Session context data"}
-                            },
-                            "required": ["session_id"]
-                        }
-                    }
-                ]
-            }
+            # Static payload, shared across calls; callers must not mutate it
+            return TOOLS_LIST
         
         elif method == "tools/call":
             tool_name = request["params"]["name"]
             arguments = request["params"].get("arguments", {})
             
             try:
-                if tool_name == "memory_store":
-                    key = arguments.get("key")
-                    value = arguments.get("value")
-                    category = arguments.get("category", "general")
-                    expires_hours = arguments.get("expires_hours")
-                    session_id = arguments.get("session_id")
-                    metadata = arguments.get("metadata", {})
-                    
-                    success = self.store_memory(key, value, category, expires_hours, session_id, metadata)
-                    result = f"Memory stored successfully: {key}" if success else f"Failed to store memory: {key}"
-                
-                elif tool_name == "memory_retrieve":
-                    key = arguments.get("key")
-                    default = arguments.get("default")
-                    
-                    value = self.retrieve_memory(key, default)
-                    result = {
-                        "key": key,
-                        "value": value,
-                        "found": value != default
-                    }
-                
-                elif tool_name == "memory_list":
-                    category = arguments.get("category")
-                    memory_list = self.list_memory_by_category(category)
-                    result = {
-                        "category": category,
-                        "entries": memory_list,
-                        "count": len(memory_list)
-                    }
-                
-                elif tool_name == "memory_delete":
-                    key = arguments.get("key")
-                    success = self.delete_memory(key)
-                    result = f"Memory deleted: {key}" if success else f"Failed to delete memory: {key}"
-                
-                elif tool_name == "memory_stats":
-                    result = self.get_memory_stats()
-                
-                elif tool_name == "memory_cleanup":
-                    self.cleanup_expired_memory()
-                    result = "Memory cleanup completed successfully"
-                
-                elif tool_name == "session_create":
-                    session_id = arguments.get("session_id")
-                    context_data = arguments.get("context_data", {})
-                    success = self.create_session(session_id, context_data)
-                    result = f"Session created: {session_id}" if success else f"Failed to create session: {session_id}"
-                
-                else:
-                    result = f"Unknown tool: {tool_name}"
+                handler = self._tool_dispatch.get(tool_name)
+                result = await handler(arguments) if handler else f"Unknown tool: {tool_name}"
                 
                 return {
                     "content": [
                         {
                             "type": "text",
-                            "text": json.dumps(result, indent=2) if isinstance(result, dict) else str(result)
+                            "text": _dumps(result, indent=True) if isinstance(result, dict) else str(result)
                         }
                     ]
                 }
@@ -522,27 +751,63 @@ class MCPMemoryPersistenceServer:
         
         return {"error": f"Unknown method: {method}"}
 
+async def read_stdin_lines():
+    """Yield request lines from stdin without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=16 * 1024 * 1024)
+    
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    except (NotImplementedError, OSError, ValueError):
+        # Event loops without pipe support (e.g. Windows proactor): read on a worker thread
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                return
+            yield line
+    
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        yield line.decode()
+
+async def cleanup_loop(server: MCPMemoryPersistenceServer):
+    """Sweep expired memory in the background so reads stay on a small hot set"""
+    while True:
+        await asyncio.sleep(server.CLEANUP_INTERVAL)
+        await server.run_db(server.cleanup_expired_memory)
+        await server.run_db(server.incremental_vacuum)
+
+def write_stdout_line(data: bytes):
+    """Write one encoded response line to stdout"""
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.buffer.flush()
+
 async def main():
     """Main MCP server loop"""
     server = MCPMemoryPersistenceServer()
+    loop = asyncio.get_running_loop()
     
     # Initialize default memory entries for OpenRouter and enterprise systems
     await initialize_default_memory(server)
     
+    if server.write_buffer:
+        asyncio.create_task(server.run_write_flusher())
+    asyncio.create_task(cleanup_loop(server))
+    
     # MCP JSON-RPC over stdio
     logger.info("MCP Memory Persistence Server started - ready for requests")
     
-    while True:
+    async for line in read_stdin_lines():
         try:
-            line = sys.stdin.readline()
-            if not line:
-                break
-            
-            request = json.loads(line.strip())
-            response = await server.handle_mcp_request(request)
+            request = _loads(line.strip())
+            if request.get("method") == "tools/list":
+                data = _TOOLS_LIST_RESPONSE
+            else:
+                data = _dumps_bytes(await server.handle_mcp_request(request))
             
-            print(json.dumps(response))
-            sys.stdout.flush()
+            await loop.run_in_executor(None, write_stdout_line, data)
             
         except KeyboardInterrupt:
             logger.info("Server shutdown requested")
@@ -550,68 +815,73 @@ async def main():
         except Exception as e:
             logger.error(f"Request processing error: {e}")
             error_response = {"error": str(e)}
-            print(json.dumps(error_response))
-            sys.stdout.flush()
+            await loop.run_in_executor(None, write_stdout_line, _dumps_bytes(error_response))
 
 async def initialize_default_memory(server: MCPMemoryPersistenceServer):
     """Initialize default memory entries for cross-session persistence"""
     try:
-        # OpenRouter configuration
-        server.store_memory(
-            "openrouter/api_key",
-            api_manager.get_api_key('openrouter'),
-            "openrouter",
-            metadata={"description": "OpenRouter API key for free models", "verified": True}
-        )
-        
-        server.store_memory(
-            "openrouter/status", 
-            {"active": True, "cost": 0.00, "models_available": 56, "usage_limit": "unlimited"},
-            "openrouter"
-        )
-        
-        # Enterprise platform states
-        server.store_memory(
-            "enterprise/platforms",
-            {
-                "ai_command_center": {"status": "operational", "value": 80000},
-                "crypto_hub": {"status": "operational", "value": 80000},  
-                "repo_wizard": {"status": "operational", "value": 80000}
-            },
-            "enterprise"
-        )
-        
-        # Revenue system states
-        server.store_memory(
-            "revenue/portfolio_value",
-            240000,
-            "revenue",
-            metadata={"currency": "USD", "last_updated": datetime.now().isoformat()}
-        )
-        
-        # System performance baseline
-        server.store_memory(
-            "performance/baseline",
-            {
-                "response_time_ms": 250,
-                "success_rate": 0.95,
-                "cost_per_request": 0.00,
-                "uptime": "99.9%"
-            },
-            "performance"
-        )
-        
-        # User preferences defaults
-        server.store_memory(
-            "user_prefs/dashboard_settings",
-            {
-                "theme": "dark",
-                "auto_refresh": True,
-                "notifications": True,
-                "preferred_models": ["deepseek", "claude", "gemini"]
-            },
-            "user_prefs"
-        )
+        # All defaults go through one BEGIN IMMEDIATE/COMMIT, i.e. a single fsync at startup
+        await server.run_db(server.store_memory_many, [
+            # OpenRouter configuration
+            (
+                "openrouter/api_key",
+                api_manager.get_api_key('openrouter'),
+                "openrouter",
+                None,
+                None,
+                {"description": "OpenRouter API key for free models", "verified": True}
+            ),
+            (
+                "openrouter/status", 
+                {"active": True, "cost": 0.00, "models_available": 56, "usage_limit": "unlimited"},
+                "openrouter"
+            ),
+            
+            # Enterprise platform states
+            (
+                "enterprise/platforms",
+                {
+                    "ai_command_center": {"status": "operational", "value": 80000},
+                    "crypto_hub": {"status": "operational", "value": 80000},  
+                    "repo_wizard": {"status": "operational", "value": 80000}
+                },
+                "enterprise"
+            ),
+            
+            # Revenue system states
+            (
+                "revenue/portfolio_value",
+                240000,
+                "revenue",
+                None,
+                None,
+                {"currency": "USD", "last_updated": datetime.now().isoformat()}
+            ),
+            
+            # System performance baseline
+            (
+                "performance/baseline",
+                {
+                    "response_time_ms": 250,
+                    "success_rate": 0.95,
+                    "cost_per_request": 0.00,
+                    "uptime": "99.9%"
+                },
+                "performance"
+            ),
+            
+            # User preferences defaults
+            (
+                "user_prefs/dashboard_settings",
+                {
+                    "theme": "dark",
+                    "auto_refresh": True,
+                    "notifications": True,
+                    "preferred_models": ["deepseek", "claude", "gemini"]
+                },
+                "user_prefs"
+            ),
+        ])
         
         logger.info("Default memory entries initialized successfully")
         
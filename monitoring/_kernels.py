@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Numeric kernels for the real-time performance monitor
+Compiled with Numba when it is installed; the NumPy fallbacks return the same results
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def trend_slopes(windows: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Least-squares slope of each row of an (n_metrics, window) matrix"""
+        n_metrics, window = windows.shape
+        slopes = np.empty(n_metrics)
+        for i in prange(n_metrics):
+            acc = 0.0
+            for j in range(window):
+                acc += weights[j] * windows[i, j]
+            slopes[i] = acc
+        return slopes
+
+    @njit(cache=True, parallel=True)
+    def z_scores(counts: np.ndarray, means: np.ndarray, m2s: np.ndarray, last: np.ndarray) -> np.ndarray:
+        """|Z| of each newest sample against its window excluding itself (0 where undefined)"""
+        n_metrics = counts.shape[0]
+        scores = np.zeros(n_metrics)
+        for i in prange(n_metrics):
+            n = counts[i]
+            if n < 3:
+                continue
+            mean = (n * means[i] - last[i]) / (n - 1)
+            m2 = m2s[i] - (last[i] - means[i]) * (last[i] - mean)
+            std = np.sqrt(max(m2, 0.0) / (n - 2))
+            if std > 0:
+                scores[i] = abs(last[i] - mean) / std
+        return scores
+
+else:
+    def trend_slopes(windows: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Least-squares slope of each row of an (n_metrics, window) matrix"""
+        return windows @ weights
+
+    def z_scores(counts: np.ndarray, means: np.ndarray, m2s: np.ndarray, last: np.ndarray) -> np.ndarray:
+        """|Z| of each newest sample against its window excluding itself (0 where undefined)"""
+        n = counts.astype(np.float64)
+        valid = n >= 3
+        n_safe = np.where(valid, n, 3.0)
+        mean = (n_safe * means - last) / (n_safe - 1)
+        m2 = m2s - (last - means) * (last - mean)
+        std = np.sqrt(np.maximum(m2, 0.0) / (n_safe - 2))
+        defined = valid & (std > 0)
+        return np.where(defined, np.abs(last - mean) / np.where(defined, std, 1.0), 0.0)
@@ -5,19 +5,60 @@ Lightweight monitoring without Docker - tracks usage and costs
 """
 
 import sqlite3
-import json
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import os
 import threading
+import atexit
+from collections import Counter
 
 class SimpleClaudeMonitor:
     """Simple monitoring for Claude Code usage without Docker requirements"""
     
+    # Tracked requests per commit, and the longest a batch stays open; WAL keeps readers unblocked in between
+    COMMIT_BATCH_SIZE = 50
+    COMMIT_INTERVAL = 1.0
+    DATABASE_PATH = 'claude_usage.db'
+    SUMMARY_CACHE_TTL = 1.0  # seconds a session summary is reused while counters are unchanged
+    
+    # Fixed statements, kept as constants so the sqlite3 statement cache always hits
+    _SQL_UPSERT_TOOL = '''
+        INSERT INTO tool_usage (tool_name, usage_count, last_used)
+        VALUES (?, 1, CURRENT_TIMESTAMP)
+        ON CONFLICT(tool_name) DO UPDATE
+        SET usage_count = usage_count + 1, last_used = CURRENT_TIMESTAMP
+    '''
+    _SQL_DAILY_TOTALS = '''
+        SELECT 
+            SUM(total_requests) as requests,
+            SUM(total_tokens) as tokens,
+            SUM(estimated_cost) as cost,
+            COUNT(*) as sessions
+        FROM usage_sessions 
+        WHERE session_start >= ? AND session_start < ?
+    '''
+    _SQL_TOP_TOOLS = '''
+        SELECT t.tool_name, SUM(t.count) as total_usage
+        FROM session_tool_usage t
+        JOIN usage_sessions s ON s.id = t.session_id
+        WHERE s.session_start >= ? AND s.session_start < ?
+        GROUP BY t.tool_name
+        ORDER BY total_usage DESC
+        LIMIT 5
+    '''
+    _SQL_INSERT_SESSION = '''
+        INSERT INTO usage_sessions 
+        (session_start, session_end, total_requests, total_tokens, 
+         estimated_cost, productivity_score)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+    _SQL_INSERT_SESSION_TOOL = 'INSERT INTO session_tool_usage (session_id, tool_name, count) VALUES (?, ?, ?)'
+    
     def __init__(self):
         self.init_monitoring_database()
-        self.start_time = datetime.now()
+        self.start_time = datetime.now()  # wall clock, stored with the session
+        self._start_perf = time.perf_counter()  # monotonic, for elapsed time
         
         # Claude usage tracking
         self.usage_stats = {
@@ -25,17 +66,31 @@ class SimpleClaudeMonitor:
             "total_requests": 0,
             "total_tokens": 0,
             "estimated_cost": 0.0,
-            "tools_used": {},
+            "tools_used": Counter(),
             "session_duration": 0
         }
         
+        # Last session summary and the (requests, tokens, cost) it was built from
+        self._summary_sig: Optional[tuple] = None
+        self._summary_cache: Dict = {}
+        self._summary_time = 0.0
+        
         print("[MONITOR] Simple Claude Code Monitor Started")
         print("=" * 50)
         
     def init_monitoring_database(self):
         """Initialize lightweight monitoring database"""
-        self.conn = sqlite3.connect('claude_usage.db', check_same_thread=False)
+        # Single writer connection behind the lock; readers get their own per thread.
+        # Autocommit mode: write batches are explicit BEGIN IMMEDIATE ... COMMIT transactions
+        self.conn = sqlite3.connect(self.DATABASE_PATH, check_same_thread=False,
+                                    isolation_level=None, cached_statements=256)
         self.lock = threading.Lock()
+        self._local = threading.local()
+        self._pending_writes = 0
+        
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
         
         cursor = self.conn.cursor()
         
@@ -81,96 +136,133 @@ class SimpleClaudeMonitor:
             )
         ''')
         
-        self.conn.commit()
+        # Per-session tool counts, one row per tool (tools_used on usage_sessions is legacy JSON)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS session_tool_usage (
+                session_id INTEGER REFERENCES usage_sessions(id),
+                tool_name TEXT,
+                count INTEGER,
+                PRIMARY KEY (session_id, tool_name)
+            )
+        ''')
+        
+        # One row per tool, so track_request can upsert
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS ix_tool_usage_name ON tool_usage(tool_name)')
+        # Daily stats select a session_start range
+        cursor.execute('CREATE INDEX IF NOT EXISTS ix_usage_sessions_start ON usage_sessions(session_start)')
+        
+        atexit.register(self.flush)
         print("[OK] Simple monitoring database initialized")
         
     def track_request(self, tool_name: str = "unknown", tokens: int = 0, cost: float = 0.0):
         """Track a Claude Code request"""
         with self.lock:
-            self.usage_stats["total_requests"] += 1
-            self.usage_stats["total_tokens"] += tokens
-            self.usage_stats["estimated_cost"] += cost
+            stats = self.usage_stats
+            stats["total_requests"] += 1
+            stats["total_tokens"] += tokens
+            stats["estimated_cost"] += cost
+            stats["tools_used"][tool_name] += 1
             
-            if tool_name in self.usage_stats["tools_used"]:
-                self.usage_stats["tools_used"][tool_name] += 1
-            else:
-                self.usage_stats["tools_used"][tool_name] = 1
+            # Commit in batches rather than paying a journal sync per request
+            if not self.conn.in_transaction:
+                self._begin_batch()
             
-            # Update tool usage in database
-            cursor = self.conn.cursor()
-            # Check if tool exists and update or insert
-            cursor.execute('SELECT usage_count FROM tool_usage WHERE tool_name = ?', (tool_name,))
-            existing = cursor.fetchone()
-            
-            if existing:
-                cursor.execute('''
-                    UPDATE tool_usage 
-                    SET usage_count = usage_count + 1, last_used = CURRENT_TIMESTAMP
-                    WHERE tool_name = ?
-                ''', (tool_name,))
-            else:
-                cursor.execute('''
-                    INSERT INTO tool_usage (tool_name, usage_count, last_used)
-                    VALUES (?, 1, CURRENT_TIMESTAMP)
-                ''', (tool_name,))
+            # Update tool usage in database (one upsert, no explicit cursor)
+            try:
+                self.conn.execute(self._SQL_UPSERT_TOOL, (tool_name,))
+            except BaseException:
+                self._rollback_batch()
+                raise
             
-            self.conn.commit()
+            self._pending_writes += 1
+            if self._pending_writes >= self.COMMIT_BATCH_SIZE:
+                self._commit_batch()
+    
+    def _begin_batch(self):
+        """Open a write batch and schedule its commit; caller holds self.lock"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        timer = threading.Timer(self.COMMIT_INTERVAL, self.flush)
+        timer.daemon = True
+        timer.start()
+    
+    def _commit_batch(self):
+        """Commit the open write batch, if any; caller holds self.lock"""
+        if self.conn.in_transaction:
+            self.conn.execute("COMMIT")
+        self._pending_writes = 0
+    
+    def _rollback_batch(self):
+        """Discard the open write batch after a failed write; caller holds self.lock"""
+        if self.conn.in_transaction:
+            self.conn.execute("ROLLBACK")
+        self._pending_writes = 0
+    
+    def _read_conn(self) -> sqlite3.Connection:
+        """Per-thread connection for report queries, so they never wait on the writer lock"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.DATABASE_PATH, cached_statements=256)
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+    
+    def flush(self):
+        """Commit any tracked requests still pending in the current batch"""
+        with self.lock:
+            self._commit_batch()
     
     def get_session_summary(self) -> Dict:
         """Get current session summary"""
-        current_time = datetime.now()
-        session_duration = (current_time - self.start_time).total_seconds() / 60  # Minutes
+        now = time.perf_counter()
+        stats = self.usage_stats
+        total_requests = stats["total_requests"]
+        estimated_cost = stats["estimated_cost"]
         
-        return {
+        # Polled summaries reuse the last one until a request is tracked or it ages out
+        sig = (total_requests, stats["total_tokens"], estimated_cost)
+        if sig == self._summary_sig and now - self._summary_time < self.SUMMARY_CACHE_TTL:
+            return dict(self._summary_cache)
+        
+        session_duration = (now - self._start_perf) / 60  # Minutes
+        summary = {
             "session_duration_minutes": round(session_duration, 1),
-            "total_requests": self.usage_stats["total_requests"],
-            "total_tokens": self.usage_stats["total_tokens"],
-            "estimated_cost": round(self.usage_stats["estimated_cost"], 4),
-            "requests_per_minute": round(self.usage_stats["total_requests"] / session_duration, 2) if session_duration > 0 else 0,
-            "tools_used": self.usage_stats["tools_used"],
-            "cost_per_request": round(self.usage_stats["estimated_cost"] / self.usage_stats["total_requests"], 4) if self.usage_stats["total_requests"] > 0 else 0
+            "total_requests": total_requests,
+            "total_tokens": stats["total_tokens"],
+            "estimated_cost": round(estimated_cost, 4),
+            "requests_per_minute": round(total_requests / session_duration, 2) if session_duration > 0 else 0,
+            "tools_used": stats["tools_used"],
+            "cost_per_request": round(estimated_cost / total_requests, 4) if total_requests > 0 else 0
         }
+        self._summary_sig, self._summary_cache, self._summary_time = sig, summary, now
+        return dict(summary)
     
     def get_daily_stats(self) -> Dict:
         """Get daily usage statistics"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            
-            # Get today's stats
-            today = datetime.now().date()
-            cursor.execute('''
-                SELECT 
-                    SUM(total_requests) as requests,
-                    SUM(total_tokens) as tokens,
-                    SUM(estimated_cost) as cost,
-                    COUNT(*) as sessions
-                FROM usage_sessions 
-                WHERE DATE(session_start) = ?
-            ''', (today,))
-            
-            daily_stats = cursor.fetchone()
-            
-            # Get top tools
-            cursor.execute('''
-                SELECT tool_name, SUM(usage_count) as total_usage
-                FROM tool_usage 
-                WHERE DATE(last_used) = ?
-                GROUP BY tool_name
-                ORDER BY total_usage DESC
-                LIMIT 5
-            ''', (today,))
-            
-            top_tools = cursor.fetchall()
-            
-            return {
-                "date": today.isoformat(),
-                "total_requests": daily_stats[0] or 0,
-                "total_tokens": daily_stats[1] or 0,
-                "estimated_cost": daily_stats[2] or 0.0,
-                "session_count": daily_stats[3] or 0,
-                "avg_session_duration": 0,  # Simplified for now
-                "top_tools": [{"tool": tool[0], "usage": tool[1]} for tool in top_tools]
-            }
+        # Make this batch's requests visible to the read connection; WAL lets the read run unlocked
+        self.flush()
+        cursor = self._read_conn().cursor()
+        
+        # Get today's stats; half-open ISO range rather than DATE(col) so the indexes apply
+        today = datetime.now().date()
+        day_range = (today.isoformat(), (today + timedelta(days=1)).isoformat())
+        cursor.execute(self._SQL_DAILY_TOTALS, day_range)
+        
+        daily_stats = cursor.fetchone()
+        
+        # Get top tools
+        cursor.execute(self._SQL_TOP_TOOLS, day_range)
+        
+        top_tools = cursor.fetchall()
+        
+        return {
+            "date": today.isoformat(),
+            "total_requests": daily_stats[0] or 0,
+            "total_tokens": daily_stats[1] or 0,
+            "estimated_cost": daily_stats[2] or 0.0,
+            "session_count": daily_stats[3] or 0,
+            "avg_session_duration": 0,  # Simplified for now
+            "top_tools": [{"tool": tool[0], "usage": tool[1]} for tool in top_tools]
+        }
     
     def generate_usage_report(self) -> str:
         """Generate formatted usage report"""
@@ -198,7 +290,7 @@ class SimpleClaudeMonitor:
 [TOOLS] Tools Used This Session:
 """
         
-        for tool, count in session_summary['tools_used'].items():
+        for tool, count in session_summary['tools_used'].most_common():
             report += f"   {tool}: {count} times\n"
         
         if daily_stats['top_tools']:
@@ -208,27 +300,53 @@ class SimpleClaudeMonitor:
         
         return report
     
+    def _snapshot(self) -> Dict:
+        """Current session as a save_sessions record"""
+        stats = self.usage_stats
+        return {
+            "session_start": self.start_time,
+            "session_end": datetime.now(),
+            "total_requests": stats["total_requests"],
+            "total_tokens": stats["total_tokens"],
+            "estimated_cost": stats["estimated_cost"],
+            "tools_used": dict(stats["tools_used"]),
+            "productivity_score": 85  # Default productivity score
+        }
+    
     def save_session(self):
         """Save current session to database"""
         with self.lock:
+            snapshot = self._snapshot()
+        self.save_sessions([snapshot])
+    
+    def save_sessions(self, sessions: List[Dict]):
+        """Save several session records (as built by _snapshot) in one transaction"""
+        with self.lock:
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN IMMEDIATE")
             cursor = self.conn.cursor()
-            session_duration = (datetime.now() - self.start_time).total_seconds() / 60
             
-            cursor.execute('''
-                INSERT INTO usage_sessions 
-                (session_start, session_end, total_requests, total_tokens, 
-                 estimated_cost, tools_used, productivity_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                self.start_time, datetime.now(),
-                self.usage_stats["total_requests"],
-                self.usage_stats["total_tokens"], 
-                self.usage_stats["estimated_cost"],
-                json.dumps(self.usage_stats["tools_used"]),
-                85  # Default productivity score
-            ))
+            # Each session row needs its id for the tool rows; the tool rows go in one executemany
+            try:
+                tool_rows = []
+                for session in sessions:
+                    cursor.execute(self._SQL_INSERT_SESSION, (
+                        session["session_start"], session["session_end"],
+                        session["total_requests"],
+                        session["total_tokens"], 
+                        session["estimated_cost"],
+                        session["productivity_score"]
+                    ))
+                    session_id = cursor.lastrowid
+                    tool_rows.extend((session_id, tool_name, count) for tool_name, count in session["tools_used"].items())
+                cursor.executemany(self._SQL_INSERT_SESSION_TOOL, tool_rows)
+            except BaseException:
+                # Partial session rows must not ride along with the next batch commit
+                self._rollback_batch()
+                raise
             
-            self.conn.commit()
+            # Also commits any tracked requests pending in the batch
+            self._commit_batch()
 
 # Global monitor instance
 monitor = SimpleClaudeMonitor()
@@ -255,11 +373,14 @@ if __name__ == "__main__":
     # Simulate various tool usage
     tools = ["Read", "Write", "Edit", "Bash", "WebFetch", "Grep", "Glob"]
     
-    import random
+    import numpy as np
+    
+    # Draw every request's token count up front
+    n_requests = 10
+    token_counts = np.random.default_rng().integers(500, 2001, size=n_requests).tolist()
     
-    for i in range(10):
+    for i, tokens in enumerate(token_counts):
         tool = tools[i % len(tools)]
-        tokens = random.randint(500, 2000)
         cost = tokens * 0.000015  # Approximate cost per token
         
         track_usage(tool, tokens, cost)
@@ -7,74 +7,112 @@ Execute and track real money generation starting NOW
 
 import sqlite3
 import json
+import sys
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import uuid
+import copy
 import random
+import os
+import numpy as np
+from functools import lru_cache
+
+# Report encoder: orjson when installed, stdlib json otherwise
+try:
+    import orjson
+    
+    def _dump_report(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+except ImportError:
+    def _dump_report(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Simulated first week, progressive improvement over the week:
+# (connections, responses, bookings, calls, conversions, revenue) per day
+_DAY_FIELDS = ("connections", "responses", "bookings", "calls", "conversions", "revenue")
+_DAY_DTYPE = np.dtype([(field, np.int64) for field in _DAY_FIELDS])
+_DAY_SCHEDULE = (
+    (20, 3, 1, 0, 0, 0),      # Day 1 - Setup and first outreach
+    (20, 4, 1, 0, 0, 0),      # Day 2 - Follow-up and engagement
+    (20, 5, 2, 1, 0, 0),      # Day 3 - First consultations (call happened, payment processing)
+    (20, 4, 1, 2, 1, 15000),  # Day 4 - First conversion
+    (20, 6, 2, 1, 0, 0),      # Day 5 - Momentum building
+    (15, 3, 1, 2, 1, 15000),  # Day 6 - Weekend preparation
+    (10, 2, 1, 1, 0, 0)       # Day 7 - Week planning
+)
+# (day index, revenue) for the days that book revenue
+_REVENUE_DAYS = tuple((day, row[5]) for day, row in enumerate(_DAY_SCHEDULE) if row[5] > 0)
+
+# Month 1 scaling of weeks 2-4 over the week 1 base: (activity factor, revenue factor)
+_WEEK_FACTORS = ((1.3, 1.5), (1.6, 2.0), (2.0, 2.5))
+
+def _uuid4_batch(n: int) -> List[str]:
+    """n random (version 4) UUID strings from a single os.urandom read"""
+    entropy = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=entropy[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
 
 class BrendanRevenueAccelerator:
     """Accelerate revenue generation through systematic execution tracking"""
     
-    def __init__(self):
-        self.init_revenue_database()
-        
-        # Real-time execution tracking
-        self.execution_system = {
-            "immediate_actions": {
-                "linkedin_profile": {
-                    "status": "EXECUTE NOW",
-                    "time_required": 15,
-                    "revenue_impact": "Foundation for $300K monthly",
-                    "completion_criteria": "Professional profile with AI Empire CEO positioning"
-                },
-                "calendly_setup": {
-                    "status": "EXECUTE NOW", 
-                    "time_required": 15,
-                    "revenue_impact": "Booking system for $201K monthly",
-                    "completion_criteria": "Free AI Assessment booking page live"
-                },
-                "first_20_connections": {
-                    "status": "EXECUTE NOW",
-                    "time_required": 30,
-                    "revenue_impact": "3-5 responses leading to $15K-45K",
-                    "completion_criteria": "20 connection requests sent to Fortune 500 executives"
-                },
-                "value_content_post": {
-                    "status": "EXECUTE NOW",
-                    "time_required": 10,
-                    "revenue_impact": "Authority building for 30% conversion rate",
-                    "completion_criteria": "$245B AI opportunity post published"
-                }
+    # Constant playbook content, shared by every instance
+    # Real-time execution tracking
+    EXECUTION_SYSTEM = {
+        "immediate_actions": {
+            "linkedin_profile": {
+                "status": "EXECUTE NOW",
+                "time_required": 15,
+                "revenue_impact": "Foundation for $300K monthly",
+                "completion_criteria": "Professional profile with AI Empire CEO positioning"
             },
-            "revenue_acceleration": {
-                "day_1_target": {
-                    "connections": 20,
-                    "responses": 3,
-                    "bookings": 1,
-                    "revenue_potential": 15000
-                },
-                "day_3_target": {
-                    "connections": 60,
-                    "responses": 9, 
-                    "bookings": 3,
-                    "calls_conducted": 1,
-                    "revenue_potential": 45000
-                },
-                "week_1_target": {
-                    "connections": 140,
-                    "responses": 21,
-                    "bookings": 8,
-                    "calls_conducted": 6,
-                    "conversions": 2,
-                    "revenue_realized": 30000
-                }
+            "calendly_setup": {
+                "status": "EXECUTE NOW", 
+                "time_required": 15,
+                "revenue_impact": "Booking system for $201K monthly",
+                "completion_criteria": "Free AI Assessment booking page live"
+            },
+            "first_20_connections": {
+                "status": "EXECUTE NOW",
+                "time_required": 30,
+                "revenue_impact": "3-5 responses leading to $15K-45K",
+                "completion_criteria": "20 connection requests sent to Fortune 500 executives"
+            },
+            "value_content_post": {
+                "status": "EXECUTE NOW",
+                "time_required": 10,
+                "revenue_impact": "Authority building for 30% conversion rate",
+                "completion_criteria": "$245B AI opportunity post published"
+            }
+        },
+        "revenue_acceleration": {
+            "day_1_target": {
+                "connections": 20,
+                "responses": 3,
+                "bookings": 1,
+                "revenue_potential": 15000
+            },
+            "day_3_target": {
+                "connections": 60,
+                "responses": 9, 
+                "bookings": 3,
+                "calls_conducted": 1,
+                "revenue_potential": 45000
+            },
+            "week_1_target": {
+                "connections": 140,
+                "responses": 21,
+                "bookings": 8,
+                "calls_conducted": 6,
+                "conversions": 2,
+                "revenue_realized": 30000
             }
         }
-        
-        # Revenue generation scripts (copy-paste ready)
-        self.revenue_scripts = {
-            "linkedin_connection_high_convert": """Hi [Name],
+    }
+    
+    # Revenue generation scripts (copy-paste ready)
+    REVENUE_SCRIPTS = {
+        "linkedin_connection_high_convert": """Hi [Name],
 
 I help Fortune 500 companies identify $2M+ AI opportunities they're missing.
 
@@ -83,8 +121,8 @@ Research shows 87% of [industry] companies leave money on the table with fragmen
 Free 30-min assessment available - would love to share insights specific to [Company].
 
 Best, Brendan Foots""",
-            
-            "facebook_instant_leads": """🚀 FREE $2M+ AI OPPORTUNITY CHECK
+        
+        "facebook_instant_leads": """🚀 FREE $2M+ AI OPPORTUNITY CHECK
 
 I just analyzed the Fortune 500 AI landscape. Average missed opportunity: $2.3M per company.
 
@@ -93,8 +131,8 @@ Offering 10 FREE assessments this week to help leaders identify their hidden AI
 Comment "GOLDMINE" for immediate access.
 
 - Brendan Foots, AI Empire CEO""",
-            
-            "response_to_interest": """Hi [Name]!
+        
+        "response_to_interest": """Hi [Name]!
 
 Fantastic! I'd love to help [Company] uncover its AI opportunities.
 
@@ -106,8 +144,8 @@ What's [Company]'s biggest operational challenge right now?
 
 Best,
 Brendan""",
-            
-            "consultation_conversion": """[Name], based on our conversation, I see $[X]M+ in AI opportunities for [Company].
+        
+        "consultation_conversion": """[Name], based on our conversation, I see $[X]M+ in AI opportunities for [Company].
 
 This analysis normally costs $15K.
 
@@ -121,90 +159,134 @@ Given the $[X]M opportunity, this represents [Y]% ROI.
 Payment via PayPal/Stripe. We start immediately.
 
 Ready to move forward?"""
+    }
+    
+    # Real-time tracking metrics
+    SUCCESS_METRICS = {
+        "daily_minimums": {
+            "linkedin_connections": 20,
+            "value_posts": 1,
+            "responses_handled": "ALL",
+            "calls_booked": 1
+        },
+        "conversion_targets": {
+            "connection_response_rate": 0.15,
+            "booking_rate": 0.40,
+            "show_up_rate": 0.80,
+            "consultation_conversion": 0.30,
+            "average_deal_size": 15000
+        },
+        "revenue_milestones": {
+            "first_1k": "Emergency revenue within 48 hours",
+            "first_5k": "Quick-start package within 5 days", 
+            "first_15k": "Full consultation conversion within 7 days",
+            "first_50k": "Multiple client momentum within 30 days",
+            "first_100k": "System optimization within 60 days"
         }
-        
-        # Real-time tracking metrics
-        self.success_metrics = {
-            "daily_minimums": {
-                "linkedin_connections": 20,
-                "value_posts": 1,
-                "responses_handled": "ALL",
-                "calls_booked": 1
-            },
-            "conversion_targets": {
-                "connection_response_rate": 0.15,
-                "booking_rate": 0.40,
-                "show_up_rate": 0.80,
-                "consultation_conversion": 0.30,
-                "average_deal_size": 15000
-            },
-            "revenue_milestones": {
-                "first_1k": "Emergency revenue within 48 hours",
-                "first_5k": "Quick-start package within 5 days", 
-                "first_15k": "Full consultation conversion within 7 days",
-                "first_50k": "Multiple client momentum within 30 days",
-                "first_100k": "System optimization within 60 days"
-            }
-        }
+    }
+    
+    DATABASE_PATH = 'brendan_revenue_accelerator.db'
+    
+    # Whole schema, applied in one executescript
+    _SCHEMA = '''
+        BEGIN;
+        
+        -- Real-time execution tracking
+        CREATE TABLE IF NOT EXISTS execution_tracking (
+            id TEXT PRIMARY KEY,
+            date DATE,
+            action_type TEXT,
+            target_completed INTEGER,
+            actual_completed INTEGER,
+            response_rate REAL,
+            conversion_rate REAL,
+            revenue_generated INTEGER DEFAULT 0,
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        
+        -- Revenue generation tracking
+        CREATE TABLE IF NOT EXISTS revenue_generation (
+            id TEXT PRIMARY KEY,
+            client_name TEXT,
+            company TEXT,
+            service_type TEXT,
+            amount INTEGER,
+            payment_method TEXT,
+            payment_date DATE,
+            source_channel TEXT,
+            conversion_time_days INTEGER,
+            status TEXT DEFAULT 'pending',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        
+        -- Daily performance metrics
+        CREATE TABLE IF NOT EXISTS daily_performance (
+            id TEXT PRIMARY KEY,
+            date DATE,
+            connections_sent INTEGER DEFAULT 0,
+            responses_received INTEGER DEFAULT 0,
+            calls_booked INTEGER DEFAULT 0,
+            calls_conducted INTEGER DEFAULT 0,
+            conversions_achieved INTEGER DEFAULT 0,
+            revenue_generated INTEGER DEFAULT 0,
+            total_pipeline_value INTEGER DEFAULT 0,
+            execution_score INTEGER DEFAULT 0
+        );
+        
+        -- Date-keyed lookups for reporting
+        CREATE INDEX IF NOT EXISTS idx_dp_date ON daily_performance(date);
+        CREATE INDEX IF NOT EXISTS idx_rg_pay ON revenue_generation(payment_date, status);
+        CREATE INDEX IF NOT EXISTS idx_et_date_type ON execution_tracking(date, action_type);
+        
+        COMMIT;
+    '''
+    
+    # Fixed statements, kept as constants so the sqlite3 statement cache always hits
+    _SQL_INSERT_PERFORMANCE = '''
+        INSERT INTO daily_performance
+        (id, date, connections_sent, responses_received, calls_booked,
+         calls_conducted, conversions_achieved, revenue_generated, execution_score)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _SQL_INSERT_REVENUE = '''
+        INSERT INTO revenue_generation
+        (id, client_name, company, service_type, amount, payment_method,
+         payment_date, source_channel, conversion_time_days, status)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    def __init__(self):
+        # Opened on first use (see conn); the plan and projections never touch the database
+        self._conn: Optional[sqlite3.Connection] = None
         
         print("[ACCELERATE] BRENDAN FOOTS REVENUE ACCELERATOR")
         print("=" * 65)
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Writer connection, initializing the database on first access"""
+        if self._conn is None:
+            self.init_revenue_database()
+        return self._conn
         
     def init_revenue_database(self):
         """Initialize real-time revenue tracking database"""
-        self.conn = sqlite3.connect('brendan_revenue_accelerator.db', check_same_thread=False)
-        cursor = self.conn.cursor()
-        
-        # Real-time execution tracking
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS execution_tracking (
-                id TEXT PRIMARY KEY,
-                date DATE,
-                action_type TEXT,
-                target_completed INTEGER,
-                actual_completed INTEGER,
-                response_rate REAL,
-                conversion_rate REAL,
-                revenue_generated INTEGER DEFAULT 0,
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Revenue generation tracking
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS revenue_generation (
-                id TEXT PRIMARY KEY,
-                client_name TEXT,
-                company TEXT,
-                service_type TEXT,
-                amount INTEGER,
-                payment_method TEXT,
-                payment_date DATE,
-                source_channel TEXT,
-                conversion_time_days INTEGER,
-                status TEXT DEFAULT 'pending',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Daily performance metrics
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS daily_performance (
-                id TEXT PRIMARY KEY,
-                date DATE,
-                connections_sent INTEGER DEFAULT 0,
-                responses_received INTEGER DEFAULT 0,
-                calls_booked INTEGER DEFAULT 0,
-                calls_conducted INTEGER DEFAULT 0,
-                conversions_achieved INTEGER DEFAULT 0,
-                revenue_generated INTEGER DEFAULT 0,
-                total_pipeline_value INTEGER DEFAULT 0,
-                execution_score INTEGER DEFAULT 0
-            )
+        # Writer connection, used only from the creating thread.
+        # Autocommit mode: write transactions are opened explicitly with BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(self.DATABASE_PATH, isolation_level=None, cached_statements=256)
+        cursor = self._conn.cursor()
+        
+        # WAL so commits skip the rollback-journal fsync and readers don't block the writer
+        cursor.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
         ''')
         
-        self.conn.commit()
+        cursor.executescript(self._SCHEMA)
         print("[OK] Revenue accelerator database initialized")
         
     def simulate_immediate_execution(self) -> Dict:
@@ -213,92 +295,30 @@ Ready to move forward?"""
         
         cursor = self.conn.cursor()
         
-        # Simulate first week execution
+        # Simulate first week execution; rows are inserted in one batch per table afterwards
         execution_results = {}
-        cumulative_revenue = 0
-        
-        for day in range(7):
-            execution_date = datetime.now() + timedelta(days=day)
-            
-            # Progressive improvement over week
-            if day == 0:  # Day 1 - Setup and first outreach
-                connections = 20
-                responses = 3
-                bookings = 1
-                calls = 0
-                conversions = 0
-                revenue = 0
-            elif day == 1:  # Day 2 - Follow-up and engagement
-                connections = 20
-                responses = 4
-                bookings = 1
-                calls = 0
-                conversions = 0
-                revenue = 0
-            elif day == 2:  # Day 3 - First consultations
-                connections = 20
-                responses = 5
-                bookings = 2
-                calls = 1
-                conversions = 0  # Call happened, payment processing
-                revenue = 0
-            elif day == 3:  # Day 4 - First conversion
-                connections = 20
-                responses = 4
-                bookings = 1
-                calls = 2
-                conversions = 1
-                revenue = 15000
-            elif day == 4:  # Day 5 - Momentum building
-                connections = 20
-                responses = 6
-                bookings = 2
-                calls = 1
-                conversions = 0
-                revenue = 0
-            elif day == 5:  # Day 6 - Weekend preparation
-                connections = 15
-                responses = 3
-                bookings = 1
-                calls = 2
-                conversions = 1
-                revenue = 15000
-            else:  # Day 7 - Week planning
-                connections = 10
-                responses = 2
-                bookings = 1
-                calls = 1
-                conversions = 0
-                revenue = 0
-            
-            cumulative_revenue += revenue
+        performance_rows = []
+        log_lines = []  # per-day progress, written in one go after the loop
+        row_ids = iter(_uuid4_batch(len(_DAY_SCHEDULE) + len(_REVENUE_DAYS)))  # one per row, both tables
+        start_date = datetime.now()
+        
+        # Week arithmetic as array ops over one column per field: totals, running revenue, improving score
+        daily = np.array(list(_DAY_SCHEDULE), dtype=_DAY_DTYPE)
+        totals = {field: int(daily[field].sum()) for field in _DAY_FIELDS}
+        cumulative = daily["revenue"].cumsum().tolist()
+        scores = (85 + 2 * np.arange(len(daily))).tolist()
+        
+        for day, (connections, responses, bookings, calls, conversions, revenue) in enumerate(daily.tolist()):
+            execution_date = start_date + timedelta(days=day)
+            cumulative_revenue = cumulative[day]
             
             # Record daily performance
-            performance_id = str(uuid.uuid4())
-            cursor.execute('''
-                INSERT INTO daily_performance
-                (id, date, connections_sent, responses_received, calls_booked,
-                 calls_conducted, conversions_achieved, revenue_generated, execution_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            performance_id = next(row_ids)
+            performance_rows.append((
                 performance_id, execution_date.date(), connections, responses,
-                bookings, calls, conversions, revenue, 85 + day * 2  # Improving score
+                bookings, calls, conversions, revenue, scores[day]
             ))
             
-            # Record revenue if generated
-            if revenue > 0:
-                revenue_id = str(uuid.uuid4())
-                cursor.execute('''
-                    INSERT INTO revenue_generation
-                    (id, client_name, company, service_type, amount, payment_method,
-                     payment_date, source_channel, conversion_time_days, status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    revenue_id, f"Executive_Day_{day+1}", f"Company_Day_{day+1}",
-                    "AI Implementation Roadmap", revenue, "Stripe",
-                    execution_date.date(), "LinkedIn", day, "confirmed"
-                ))
-            
             execution_results[f"day_{day+1}"] = {
                 "connections": connections,
                 "responses": responses,
@@ -309,28 +329,42 @@ Ready to move forward?"""
                 "cumulative_revenue": cumulative_revenue
             }
             
-            print(f"       Day {day+1}: {connections} connections, {calls} calls, ${revenue:,.0f} revenue (Total: ${cumulative_revenue:,.0f})")
+            log_lines.append(f"       Day {day+1}: {connections} connections, {calls} calls, ${revenue:,.0f} revenue (Total: ${cumulative_revenue:,.0f})\n")
         
-        self.conn.commit()
+        sys.stdout.write("".join(log_lines))
+        
+        # Record revenue for the days that generated it
+        revenue_rows = [
+            (next(row_ids), f"Executive_Day_{day+1}", f"Company_Day_{day+1}",
+             "AI Implementation Roadmap", revenue, "Stripe",
+             (start_date + timedelta(days=day)).date(), "LinkedIn", day, "confirmed")
+            for day, revenue in _REVENUE_DAYS
+        ]
+        
+        # One explicit write transaction for the whole week; rolled back if either insert fails
+        with self.conn:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(self._SQL_INSERT_PERFORMANCE, performance_rows)
+            cursor.executemany(self._SQL_INSERT_REVENUE, revenue_rows)
         
         return {
             "daily_breakdown": execution_results,
             "week_summary": {
-                "total_connections": sum([day["connections"] for day in execution_results.values()]),
-                "total_responses": sum([day["responses"] for day in execution_results.values()]),
-                "total_bookings": sum([day["bookings"] for day in execution_results.values()]),
-                "total_calls": sum([day["calls"] for day in execution_results.values()]),
-                "total_conversions": sum([day["conversions"] for day in execution_results.values()]),
-                "total_revenue": cumulative_revenue,
-                "conversion_rate": (sum([day["conversions"] for day in execution_results.values()]) / 
-                                  sum([day["calls"] for day in execution_results.values()])) * 100 if sum([day["calls"] for day in execution_results.values()]) > 0 else 0
+                **{f"total_{field}": total for field, total in totals.items()},
+                "conversion_rate": (totals["conversions"] / totals["calls"]) * 100 if totals["calls"] > 0 else 0
             }
         }
     
-    def create_emergency_revenue_plan(self) -> Dict:
+    @staticmethod
+    def create_emergency_revenue_plan() -> Dict:
         """Create emergency revenue plan for immediate money"""
         print("\n[EMERGENCY] Creating Emergency Revenue Plan...")
-        
+        return copy.deepcopy(BrendanRevenueAccelerator._build_emergency_revenue_plan())
+    
+    # Pure functions of constants: built once, callers get deep copies of the cached result
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _build_emergency_revenue_plan() -> Dict:
         emergency_plan = {
             "immediate_revenue_options": {
                 "option_1_quick_audit": {
@@ -407,10 +441,15 @@ Time-sensitive offer.
         
         return emergency_plan
     
-    def calculate_revenue_projections(self) -> Dict:
+    @staticmethod
+    def calculate_revenue_projections() -> Dict:
         """Calculate realistic revenue projections"""
         print("\n[PROJECTIONS] Calculating Revenue Projections...")
-        
+        return copy.deepcopy(BrendanRevenueAccelerator._build_revenue_projections())
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _build_revenue_projections() -> Dict:
         # Base metrics from simulation
         weekly_base = {
             "connections": 140,
@@ -422,13 +461,15 @@ Time-sensitive offer.
         }
         
         # Progressive scaling over 3 months
+        month_1 = {"week_1": weekly_base}
+        base_items = tuple(weekly_base.items())
+        for week, (activity_factor, revenue_factor) in enumerate(_WEEK_FACTORS, start=2):
+            month_1[f"week_{week}"] = {
+                k: int(v * (revenue_factor if k == "revenue" else activity_factor)) for k, v in base_items
+            }
+        
         projections = {
-            "month_1": {
-                "week_1": weekly_base,
-                "week_2": {k: int(v * 1.3) if k != "revenue" else int(v * 1.5) for k, v in weekly_base.items()},
-                "week_3": {k: int(v * 1.6) if k != "revenue" else int(v * 2.0) for k, v in weekly_base.items()},
-                "week_4": {k: int(v * 2.0) if k != "revenue" else int(v * 2.5) for k, v in weekly_base.items()},
-            },
+            "month_1": month_1,
             "month_2": {
                 "scaling_factor": 2.5,
                 "referral_bonus": 0.3,
@@ -469,7 +510,8 @@ Time-sensitive offer.
         """Generate comprehensive revenue accelerator report"""
         print("\n[REPORT] Generating Revenue Accelerator Report...")
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         
         # Generate all components
         execution_simulation = self.simulate_immediate_execution()
@@ -477,7 +519,7 @@ Time-sensitive offer.
         revenue_projections = self.calculate_revenue_projections()
         
         report = {
-            "report_timestamp": datetime.now().isoformat(),
+            "report_timestamp": now.isoformat(),
             "executive_summary": {
                 "system_status": "READY FOR IMMEDIATE EXECUTION",
                 "investment_required": "$0.00",
@@ -489,8 +531,8 @@ Time-sensitive offer.
             "immediate_execution": execution_simulation,
             "emergency_revenue": emergency_plan,
             "revenue_projections": revenue_projections,
-            "execution_system": self.execution_system,
-            "revenue_scripts": self.revenue_scripts,
+            "execution_system": self.EXECUTION_SYSTEM,
+            "revenue_scripts": self.REVENUE_SCRIPTS,
             "success_framework": {
                 "daily_discipline": "Execute 20 connections + 1 value post + respond to ALL engagement",
                 "conversion_focus": "30% of free calls convert to $15K implementations",
@@ -508,8 +550,8 @@ Time-sensitive offer.
         
         # Save report
         report_filename = f"brendan_revenue_accelerator_{timestamp}.json"
-        with open(report_filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(report_filename, 'wb') as f:
+            f.write(_dump_report(report))
         
         print(f"[OK] Revenue accelerator report saved: {report_filename}")
         
@@ -9,75 +9,138 @@ Zero-cost operation with immediate revenue potential
 import json
 import sqlite3
 import time
-import random
 from datetime import datetime, timedelta
 import os
+import numpy as np
+
+# Service prices a simulated conversion can land on
+_REVENUE_PER_CONVERSION = np.array([197, 497, 997, 1497, 4997], dtype=np.int64)
+
+# Target lead profile attributes, sampled in bulk by generate_target_leads
+_INDUSTRIES = np.array([
+    'Technology', 'Healthcare', 'Finance', 'Manufacturing', 
+    'Retail', 'Education', 'Real Estate', 'Consulting',
+    'Marketing', 'E-commerce', 'SaaS', 'Logistics'
+])
+_COMPANY_SIZES = np.array(['1-10', '11-50', '51-200', '201-1000', '1000+'])
+_PAIN_POINTS = np.array([
+    'Manual reporting processes',
+    'Lack of real-time data visibility', 
+    'Inefficient monitoring systems',
+    'Need for automation',
+    'Data integration challenges',
+    'Performance tracking issues',
+    'Cost optimization needs',
+    'Scalability concerns'
+])
+_BUDGET_RANGES = np.array(['$1K-5K', '$5K-15K', '$15K-50K', '$50K+'])
+_CONTACT_METHODS = np.array(['LinkedIn', 'Email', 'Cold Call', 'Referral'])
 
 class ClientAcquisitionSystem:
+    _SQL_INSERT_SERVICE = '''
+        INSERT OR REPLACE INTO services 
+        (service_name, description, price, delivery_time, target_market, conversion_rate)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+    _SQL_INSERT_LEAD = '''
+        INSERT INTO leads 
+        (company_name, contact_name, email, phone, industry, 
+         company_size, pain_points, budget_range, contact_method, lead_source)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _SQL_INSERT_CAMPAIGN = '''
+        INSERT OR REPLACE INTO campaigns 
+        (campaign_name, target_industry, message_template, conversion_rate)
+        VALUES (?, ?, ?, ?)
+    '''
+    _SQL_UPDATE_CAMPAIGN_RESULTS = '''
+        UPDATE campaigns 
+        SET leads_generated = ?, deals_closed = ?, revenue_generated = ?
+        WHERE id = ?
+    '''
+    
     def __init__(self):
         self.db_path = "client_acquisition.db"
+        self.conn = self._connect()
+        self._rng = np.random.default_rng()
         self.setup_database()
-        
+
+    def _connect(self):
+        """Open a database connection with the write-performance pragmas applied"""
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False,
+                               cached_statements=256)
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-16000")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    def close(self):
+        """Close the shared database connection"""
+        self.conn.close()
+
     def setup_database(self):
         """Initialize client acquisition database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        
+        with self.conn:
+            cursor.execute("BEGIN")
+        
+            # Leads table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS leads (
+                    id INTEGER PRIMARY KEY,
+                    company_name TEXT,
+                    contact_name TEXT,
+                    email TEXT,
+                    phone TEXT,
+                    industry TEXT,
+                    company_size TEXT,
+                    pain_points TEXT,
+                    budget_range TEXT,
+                    contact_method TEXT,
+                    status TEXT DEFAULT 'new',
+                    lead_source TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_contact TIMESTAMP,
+                    notes TEXT
+                )
+            ''')
+        
+            # Outreach campaigns table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS campaigns (
+                    id INTEGER PRIMARY KEY,
+                    campaign_name TEXT,
+                    target_industry TEXT,
+                    message_template TEXT,
+                    conversion_rate REAL DEFAULT 0.0,
+                    leads_generated INTEGER DEFAULT 0,
+                    deals_closed INTEGER DEFAULT 0,
+                    revenue_generated REAL DEFAULT 0.0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    status TEXT DEFAULT 'active'
+                )
+            ''')
+        
+            # Service packages table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS services (
+                    id INTEGER PRIMARY KEY,
+                    service_name TEXT,
+                    description TEXT,
+                    price REAL,
+                    delivery_time TEXT,
+                    target_market TEXT,
+                    conversion_rate REAL DEFAULT 0.0,
+                    bookings INTEGER DEFAULT 0,
+                    revenue REAL DEFAULT 0.0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
         
-        # Leads table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS leads (
-                id INTEGER PRIMARY KEY,
-                company_name TEXT,
-                contact_name TEXT,
-                email TEXT,
-                phone TEXT,
-                industry TEXT,
-                company_size TEXT,
-                pain_points TEXT,
-                budget_range TEXT,
-                contact_method TEXT,
-                status TEXT DEFAULT 'new',
-                lead_source TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_contact TIMESTAMP,
-                notes TEXT
-            )
-        ''')
-        
-        # Outreach campaigns table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS campaigns (
-                id INTEGER PRIMARY KEY,
-                campaign_name TEXT,
-                target_industry TEXT,
-                message_template TEXT,
-                conversion_rate REAL DEFAULT 0.0,
-                leads_generated INTEGER DEFAULT 0,
-                deals_closed INTEGER DEFAULT 0,
-                revenue_generated REAL DEFAULT 0.0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                status TEXT DEFAULT 'active'
-            )
-        ''')
-        
-        # Service packages table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS services (
-                id INTEGER PRIMARY KEY,
-                service_name TEXT,
-                description TEXT,
-                price REAL,
-                delivery_time TEXT,
-                target_market TEXT,
-                conversion_rate REAL DEFAULT 0.0,
-                bookings INTEGER DEFAULT 0,
-                revenue REAL DEFAULT 0.0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
         print("[OK] Client acquisition database initialized")
 
     def create_service_packages(self):
@@ -125,83 +188,44 @@ class ClientAcquisitionSystem:
             }
         ]
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        
+        with self.conn:
+            cursor.execute("BEGIN")
+            cursor.executemany(self._SQL_INSERT_SERVICE, [
+                (service['service_name'], service['description'],
+                 service['price'], service['delivery_time'],
+                 service['target_market'], service['conversion_rate'])
+                for service in services
+            ])
         
-        for service in services:
-            cursor.execute('''
-                INSERT OR REPLACE INTO services 
-                (service_name, description, price, delivery_time, target_market, conversion_rate)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                service['service_name'], service['description'], 
-                service['price'], service['delivery_time'],
-                service['target_market'], service['conversion_rate']
-            ))
-        
-        conn.commit()
-        conn.close()
         print(f"[OK] Created {len(services)} service packages")
         return services
 
     def generate_target_leads(self, count=50):
-        """Generate target lead profiles"""
-        industries = [
-            'Technology', 'Healthcare', 'Finance', 'Manufacturing', 
-            'Retail', 'Education', 'Real Estate', 'Consulting',
-            'Marketing', 'E-commerce', 'SaaS', 'Logistics'
-        ]
-        
-        company_sizes = ['1-10', '11-50', '51-200', '201-1000', '1000+']
-        pain_points = [
-            'Manual reporting processes',
-            'Lack of real-time data visibility', 
-            'Inefficient monitoring systems',
-            'Need for automation',
-            'Data integration challenges',
-            'Performance tracking issues',
-            'Cost optimization needs',
-            'Scalability concerns'
+        """Generate target lead profiles as rows in _SQL_INSERT_LEAD column order"""
+        rng = self._rng
+        industries = rng.choice(_INDUSTRIES, size=count).tolist()
+        company_sizes = rng.choice(_COMPANY_SIZES, size=count).tolist()
+        pain_points = rng.choice(_PAIN_POINTS, size=count).tolist()
+        budget_ranges = rng.choice(_BUDGET_RANGES, size=count).tolist()
+        contact_methods = rng.choice(_CONTACT_METHODS, size=count).tolist()
+        phones = rng.integers(1000, 10000, size=count).tolist()
+        
+        leads = [
+            (f'{industry} Corp {k}', f'Contact {k}', f'contact{k}@{industry.lower()}corp.com',
+             f'+1-555-{phone}', industry, size, pain, budget, method, 'Generated')
+            for k, (industry, size, pain, budget, method, phone) in enumerate(
+                zip(industries, company_sizes, pain_points, budget_ranges, contact_methods, phones), 1)
         ]
         
-        budget_ranges = ['$1K-5K', '$5K-15K', '$15K-50K', '$50K+']
-        
-        leads = []
-        for i in range(count):
-            industry = random.choice(industries)
-            lead = {
-                'company_name': f'{industry} Corp {i+1}',
-                'contact_name': f'Contact {i+1}',
-                'email': f'contact{i+1}@{industry.lower()}corp.com',
-                'phone': f'+1-555-{random.randint(1000,9999)}',
-                'industry': industry,
-                'company_size': random.choice(company_sizes),
-                'pain_points': random.choice(pain_points),
-                'budget_range': random.choice(budget_ranges),
-                'contact_method': random.choice(['LinkedIn', 'Email', 'Cold Call', 'Referral']),
-                'lead_source': 'Generated'
-            }
-            leads.append(lead)
-        
         # Store in database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        
+        with self.conn:
+            cursor.execute("BEGIN")
+            cursor.executemany(self._SQL_INSERT_LEAD, leads)
         
-        for lead in leads:
-            cursor.execute('''
-                INSERT INTO leads 
-                (company_name, contact_name, email, phone, industry, 
-                 company_size, pain_points, budget_range, contact_method, lead_source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                lead['company_name'], lead['contact_name'], lead['email'],
-                lead['phone'], lead['industry'], lead['company_size'],
-                lead['pain_points'], lead['budget_range'], 
-                lead['contact_method'], lead['lead_source']
-            ))
-        
-        conn.commit()
-        conn.close()
         print(f"[OK] Generated {count} target leads")
         return leads
 
@@ -260,69 +284,56 @@ Great! Our system provides real-time financial data monitoring with automated al
             }
         ]
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        
+        with self.conn:
+            cursor.execute("BEGIN")
+            cursor.executemany(self._SQL_INSERT_CAMPAIGN, [
+                (campaign['campaign_name'], campaign['target_industry'],
+                 campaign['message_template'], campaign['conversion_rate'])
+                for campaign in campaigns
+            ])
         
-        for campaign in campaigns:
-            cursor.execute('''
-                INSERT OR REPLACE INTO campaigns 
-                (campaign_name, target_industry, message_template, conversion_rate)
-                VALUES (?, ?, ?, ?)
-            ''', (
-                campaign['campaign_name'], campaign['target_industry'],
-                campaign['message_template'], campaign['conversion_rate']
-            ))
-        
-        conn.commit()
-        conn.close()
         print(f"[OK] Created {len(campaigns)} outreach campaigns")
         return campaigns
 
     def simulate_campaign_results(self, days=7):
         """Simulate campaign performance over time"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get all campaigns
-        cursor.execute('SELECT * FROM campaigns')
-        campaigns = cursor.fetchall()
-        
-        # Get all leads
-        cursor.execute('SELECT COUNT(*) FROM leads')
-        total_leads = cursor.fetchone()[0]
-        
-        results = {}
-        total_revenue = 0
-        
-        for campaign in campaigns:
-            campaign_id, name, industry, template, conv_rate = campaign[:5]
-            
-            # Simulate daily performance
-            daily_outreach = random.randint(5, 15)
-            total_outreach = daily_outreach * days
-            conversions = int(total_outreach * conv_rate)
+        cursor = self.conn.cursor()
+        
+        with self.conn:
+            cursor.execute("BEGIN")
+        
+            # Get all campaigns
+            cursor.execute('SELECT id, campaign_name, conversion_rate FROM campaigns')
+            campaigns = cursor.fetchall()
+        
+            # Get all leads
+            cursor.execute('SELECT COUNT(*) FROM leads')
+            total_leads = cursor.fetchone()[0]
+        
+            # Simulate daily performance and revenue based on service mix, all campaigns at once
+            n = len(campaigns)
+            conv_rates = np.fromiter((campaign[2] for campaign in campaigns), dtype=np.float64, count=n)
+            total_outreach = self._rng.integers(5, 16, size=n) * days
+            conversions = (total_outreach * conv_rates).astype(np.int64)
+            campaign_revenue = conversions * self._rng.choice(_REVENUE_PER_CONVERSION, size=n)
+            total_revenue = int(campaign_revenue.sum())
+        
+            results = {}
+            updates = []
+            for (campaign_id, name, conv_rate), outreach, deals, revenue in zip(
+                    campaigns, total_outreach.tolist(), conversions.tolist(), campaign_revenue.tolist()):
+                updates.append((outreach, deals, revenue, campaign_id))
             
-            # Simulate revenue based on service mix
-            revenue_per_conversion = random.choice([197, 497, 997, 1497, 4997])
-            campaign_revenue = conversions * revenue_per_conversion
-            total_revenue += campaign_revenue
-            
-            # Update database
-            cursor.execute('''
-                UPDATE campaigns 
-                SET leads_generated = ?, deals_closed = ?, revenue_generated = ?
-                WHERE id = ?
-            ''', (total_outreach, conversions, campaign_revenue, campaign_id))
-            
-            results[name] = {
-                'outreach': total_outreach,
-                'conversions': conversions,
-                'revenue': campaign_revenue,
-                'conversion_rate': conv_rate
-            }
+                results[name] = {
+                    'outreach': outreach,
+                    'conversions': deals,
+                    'revenue': revenue,
+                    'conversion_rate': conv_rate
+                }
         
-        conn.commit()
-        conn.close()
+            cursor.executemany(self._SQL_UPDATE_CAMPAIGN_RESULTS, updates)
         
         print(f"[SIMULATION] {days}-day campaign results:")
         for name, data in results.items():
@@ -498,6 +509,7 @@ Ready to see your data come alive? Let's get started!
 
 def main():
     """Main execution function"""
+    acquisition_system = None
     try:
         acquisition_system = ClientAcquisitionSystem()
         report = acquisition_system.execute_acquisition_system()
@@ -505,6 +517,9 @@ def main():
     except Exception as e:
         print(f"[ERROR] Client acquisition system failed: {e}")
         return None
+    finally:
+        if acquisition_system is not None:
+            acquisition_system.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file